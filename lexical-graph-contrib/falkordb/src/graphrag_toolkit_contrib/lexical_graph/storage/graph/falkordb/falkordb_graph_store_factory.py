@@ -16,6 +16,8 @@ QUERY_RESULT_TYPE = Union[List[List[Node]], List[List[List[Path]]], List[List[Ed
 
 class FalkorDBGraphStoreFactory(GraphStoreFactoryMethod):
 
+    prefixes = (FALKORDB,)
+
     def try_create(self, graph_info:str, **kwargs) -> GraphStore:
         endpoint_url = None
         if graph_info.startswith(FALKORDB):
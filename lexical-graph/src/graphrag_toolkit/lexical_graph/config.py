@@ -44,6 +44,14 @@ DEFAULT_BATCH_WRITES_ENABLED = True
 DEFAULT_INCLUDE_DOMAIN_LABELS = False
 DEFAULT_INCLUDE_LOCAL_ENTITIES = False
 DEFAULT_ENABLE_CACHE = False
+DEFAULT_VECTOR_QUERY_CACHE_SIZE = 0
+DEFAULT_VECTOR_QUERY_CACHE_TTL_SECONDS = 300
+DEFAULT_VECTOR_QUERY_OVERFETCH_FACTOR = 5
+DEFAULT_VECTOR_QUERY_BATCHING_ENABLED = False
+DEFAULT_EMBEDDING_CACHE_SIZE = 0
+DEFAULT_QUERY_TREE_NUM_WORKERS = 1
+DEFAULT_NEPTUNE_CONNECT_TIMEOUT_SECONDS = 60
+DEFAULT_NEPTUNE_MAX_POOL_CONNECTIONS = 10
 DEFAULT_METADATA_DATETIME_SUFFIXES = ['_date', '_datetime']
 
 def _is_json_string(s):
@@ -253,6 +261,14 @@ class _GraphRAGConfig:
         _include_domain_labels (Optional[bool]): Whether domain-specific labels are included in processes.
         _include_local_entities (Optional[bool]): Whether local entities are included in the graph.
         _enable_cache (Optional[bool]): Boolean flag to enable or disable caching mechanisms.
+        _vector_query_cache_size (Optional[int]): Maximum number of vector top-k query results cached per process.
+        _vector_query_cache_ttl_seconds (Optional[int]): Time-to-live, in seconds, of cached vector top-k query results.
+        _vector_query_overfetch_factor (Optional[int]): Multiple of top-k candidates fetched from graph-based vector indexes before filtering.
+        _vector_query_batching_enabled (Optional[bool]): Flag indicating whether retrievers issue their vector queries through top_k_batch.
+        _embedding_cache_size (Optional[int]): Maximum number of node embeddings cached per vector index, keyed by content hash.
+        _query_tree_num_workers (Optional[int]): Maximum number of queries in a query tree run concurrently against the graph store at query time.
+        _neptune_connect_timeout_seconds (Optional[int]): Connection timeout, in seconds, of Neptune clients.
+        _neptune_max_pool_connections (Optional[int]): Maximum number of pooled connections kept by each Neptune client.
         _metadata_datetime_suffixes (Optional[List[str]]): List of datetime suffixes included in metadata handling.
     """
     _aws_profile: Optional[str] = None
@@ -278,6 +294,14 @@ class _GraphRAGConfig:
     _include_domain_labels: Optional[bool] = None
     _include_local_entities: Optional[bool] = None
     _enable_cache: Optional[bool] = None
+    _vector_query_cache_size: Optional[int] = None
+    _vector_query_cache_ttl_seconds: Optional[int] = None
+    _vector_query_overfetch_factor: Optional[int] = None
+    _vector_query_batching_enabled: Optional[bool] = None
+    _embedding_cache_size: Optional[int] = None
+    _query_tree_num_workers: Optional[int] = None
+    _neptune_connect_timeout_seconds: Optional[int] = None
+    _neptune_max_pool_connections: Optional[int] = None
     _metadata_datetime_suffixes: Optional[List[str]] = None
 
     @contextlib.contextmanager
@@ -792,6 +816,172 @@ class _GraphRAGConfig:
         """
         self._enable_cache = enable_cache
 
+    @property
+    def vector_query_cache_size(self) -> int:
+        """
+        Gets the maximum number of top-k query results held in the process-wide cache
+        shared by Neptune Analytics vector indexes.
+
+        If not already set, the value is read from the `VECTOR_QUERY_CACHE_SIZE`
+        environment variable, defaulting to `DEFAULT_VECTOR_QUERY_CACHE_SIZE`. A value
+        of 0 disables the cache.
+
+        Returns:
+            int: The maximum number of cached top-k query results.
+        """
+        if self._vector_query_cache_size is None:
+            self.vector_query_cache_size = int(os.environ.get('VECTOR_QUERY_CACHE_SIZE', DEFAULT_VECTOR_QUERY_CACHE_SIZE))
+        return self._vector_query_cache_size
+
+    @vector_query_cache_size.setter
+    def vector_query_cache_size(self, cache_size: int) -> None:
+        self._vector_query_cache_size = cache_size
+
+    @property
+    def vector_query_cache_ttl_seconds(self) -> int:
+        """
+        Gets the time-to-live, in seconds, of cached vector top-k query results.
+
+        If not already set, the value is read from the `VECTOR_QUERY_CACHE_TTL_SECONDS`
+        environment variable, defaulting to `DEFAULT_VECTOR_QUERY_CACHE_TTL_SECONDS`.
+
+        Returns:
+            int: The number of seconds a cached top-k query result remains valid.
+        """
+        if self._vector_query_cache_ttl_seconds is None:
+            self.vector_query_cache_ttl_seconds = int(os.environ.get('VECTOR_QUERY_CACHE_TTL_SECONDS', DEFAULT_VECTOR_QUERY_CACHE_TTL_SECONDS))
+        return self._vector_query_cache_ttl_seconds
+
+    @vector_query_cache_ttl_seconds.setter
+    def vector_query_cache_ttl_seconds(self, ttl_seconds: int) -> None:
+        self._vector_query_cache_ttl_seconds = ttl_seconds
+
+    @property
+    def vector_query_overfetch_factor(self) -> int:
+        """
+        Gets the multiple of top-k candidates that graph-based vector indexes fetch
+        from the vector search before applying tenant and metadata filters.
+
+        If not already set, the value is read from the `VECTOR_QUERY_OVERFETCH_FACTOR`
+        environment variable, defaulting to `DEFAULT_VECTOR_QUERY_OVERFETCH_FACTOR`.
+        Single-tenant graphs queried without metadata filters can use a value of 1.
+
+        Returns:
+            int: The top-k overfetch factor.
+        """
+        if self._vector_query_overfetch_factor is None:
+            self.vector_query_overfetch_factor = int(os.environ.get('VECTOR_QUERY_OVERFETCH_FACTOR', DEFAULT_VECTOR_QUERY_OVERFETCH_FACTOR))
+        return self._vector_query_overfetch_factor
+
+    @vector_query_overfetch_factor.setter
+    def vector_query_overfetch_factor(self, overfetch_factor: int) -> None:
+        self._vector_query_overfetch_factor = overfetch_factor
+
+    @property
+    def vector_query_batching_enabled(self) -> bool:
+        """
+        Determines whether retrievers that run several vector queries at once, such as
+        entity-network search, submit them together through `VectorIndex.top_k_batch`
+        rather than calling `top_k` for each query.
+
+        If not already set, the value is read from the `VECTOR_QUERY_BATCHING_ENABLED`
+        environment variable, defaulting to `DEFAULT_VECTOR_QUERY_BATCHING_ENABLED`.
+
+        Returns:
+            bool: True if vector queries are submitted through `top_k_batch`.
+        """
+        if self._vector_query_batching_enabled is None:
+            self.vector_query_batching_enabled = string_to_bool(os.environ.get('VECTOR_QUERY_BATCHING_ENABLED'), DEFAULT_VECTOR_QUERY_BATCHING_ENABLED)
+        return self._vector_query_batching_enabled
+
+    @vector_query_batching_enabled.setter
+    def vector_query_batching_enabled(self, batching_enabled: bool) -> None:
+        self._vector_query_batching_enabled = batching_enabled
+
+    @property
+    def embedding_cache_size(self) -> int:
+        """
+        Gets the maximum number of node embeddings each vector index caches, keyed by
+        a hash of the content that is embedded.
+
+        If not already set, the value is read from the `EMBEDDING_CACHE_SIZE`
+        environment variable, defaulting to `DEFAULT_EMBEDDING_CACHE_SIZE`. A value
+        of 0 disables the cache, and every node is embedded by the embedding model.
+
+        Returns:
+            int: The maximum number of cached embeddings per index.
+        """
+        if self._embedding_cache_size is None:
+            self.embedding_cache_size = int(os.environ.get('EMBEDDING_CACHE_SIZE', DEFAULT_EMBEDDING_CACHE_SIZE))
+        return self._embedding_cache_size
+
+    @embedding_cache_size.setter
+    def embedding_cache_size(self, cache_size: int) -> None:
+        self._embedding_cache_size = cache_size
+
+    @property
+    def query_tree_num_workers(self) -> int:
+        """
+        Gets the maximum number of queries in a query tree that are run concurrently
+        against the graph store.
+
+        If not already set, the value is read from the `QUERY_TREE_NUM_WORKERS`
+        environment variable, defaulting to `DEFAULT_QUERY_TREE_NUM_WORKERS`. A value
+        of 1 runs the queries in a query tree one at a time.
+
+        Returns:
+            int: The maximum number of concurrently run query tree queries.
+        """
+        if self._query_tree_num_workers is None:
+            self.query_tree_num_workers = int(os.environ.get('QUERY_TREE_NUM_WORKERS', DEFAULT_QUERY_TREE_NUM_WORKERS))
+        return self._query_tree_num_workers
+
+    @query_tree_num_workers.setter
+    def query_tree_num_workers(self, num_workers: int) -> None:
+        self._query_tree_num_workers = num_workers
+
+    @property
+    def neptune_connect_timeout_seconds(self) -> int:
+        """
+        Gets the time, in seconds, that Neptune clients wait to establish a connection.
+
+        If not already set, the value is read from the `NEPTUNE_CONNECT_TIMEOUT_SECONDS`
+        environment variable, defaulting to `DEFAULT_NEPTUNE_CONNECT_TIMEOUT_SECONDS`,
+        which is the botocore default.
+
+        Returns:
+            int: The Neptune client connection timeout, in seconds.
+        """
+        if self._neptune_connect_timeout_seconds is None:
+            self.neptune_connect_timeout_seconds = int(os.environ.get('NEPTUNE_CONNECT_TIMEOUT_SECONDS', DEFAULT_NEPTUNE_CONNECT_TIMEOUT_SECONDS))
+        return self._neptune_connect_timeout_seconds
+
+    @neptune_connect_timeout_seconds.setter
+    def neptune_connect_timeout_seconds(self, timeout_seconds: int) -> None:
+        self._neptune_connect_timeout_seconds = timeout_seconds
+
+    @property
+    def neptune_max_pool_connections(self) -> int:
+        """
+        Gets the maximum number of connections each Neptune client keeps in its
+        connection pool.
+
+        If not already set, the value is read from the `NEPTUNE_MAX_POOL_CONNECTIONS`
+        environment variable, defaulting to `DEFAULT_NEPTUNE_MAX_POOL_CONNECTIONS`,
+        which is the botocore default. Raise this value when running more concurrent
+        queries against a single graph store, e.g. with `query_tree_num_workers`.
+
+        Returns:
+            int: The maximum number of pooled connections per Neptune client.
+        """
+        if self._neptune_max_pool_connections is None:
+            self.neptune_max_pool_connections = int(os.environ.get('NEPTUNE_MAX_POOL_CONNECTIONS', DEFAULT_NEPTUNE_MAX_POOL_CONNECTIONS))
+        return self._neptune_max_pool_connections
+
+    @neptune_max_pool_connections.setter
+    def neptune_max_pool_connections(self, max_pool_connections: int) -> None:
+        self._neptune_max_pool_connections = max_pool_connections
+
     @property
     def metadata_datetime_suffixes(self) -> List[str]:
         """
@@ -1,8 +1,10 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import re
 import logging
 import abc
+from functools import lru_cache
 from typing import Callable, Any, Dict, List, Optional, Union
 from dateutil.parser import parse
 from datetime import datetime, date
@@ -16,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 MetadataFiltersType = Union[MetadataFilters, MetadataFilter, List[MetadataFilter]]
 
+DATETIME_PARSE_CACHE_SIZE = 2048
+ISO_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
 
 def is_datetime_key(key):
     """Determines if the given key corresponds to a datetime metadata field.
@@ -33,6 +38,30 @@ def is_datetime_key(key):
     return key.endswith(tuple(GraphRAGConfig.metadata_datetime_suffixes))
 
 
+@lru_cache(maxsize=DATETIME_PARSE_CACHE_SIZE)
+def _parse_datetime_str(s: str, today: date) -> Optional[datetime]:
+    # today is part of the cache key because dateutil fills in missing date
+    # components (e.g. for '10:30' or 'March 5') from the current date
+    if ISO_DATE_PATTERN.match(s):
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
+    try:
+        return parse(s, fuzzy=False)
+    except ValueError:
+        return None
+
+
+def _try_parse_datetime(s: Any) -> Optional[datetime]:
+    if isinstance(s, str):
+        return _parse_datetime_str(s, date.today())
+    try:
+        return parse(s, fuzzy=False)
+    except ValueError:
+        return None
+
+
 def format_datetime(s: Any):
     """
     Formats a date or datetime object or parses a string into an ISO 8601 formatted string.
@@ -40,7 +69,8 @@ def format_datetime(s: Any):
     This function takes a datetime or date object and formats it into an ISO 8601
     string. If provided with a string, it attempts to parse the string into a
     datetime object and then formats it as an ISO 8601 string. The function ensures
-    strict parsing for string inputs.
+    strict parsing for string inputs. Parsed strings are cached, so repeated values
+    are only parsed once.
 
     Args:
         s: A datetime object, date object, or a string representing a date or
@@ -51,8 +81,11 @@ def format_datetime(s: Any):
     """
     if isinstance(s, datetime) or isinstance(s, date):
         return s.isoformat()
-    else:
-        return parse(s, fuzzy=False).isoformat()
+    dt = _try_parse_datetime(s)
+    if dt is None:
+        # re-parse to raise dateutil's own error for the invalid value
+        dt = parse(s, fuzzy=False)
+    return dt.isoformat()
 
 
 def type_name_for_key_value(key: str, value: Any) -> str:
@@ -84,15 +117,26 @@ def type_name_for_key_value(key: str, value: Any) -> str:
         if isinstance(value, datetime) or isinstance(value, date):
             return 'timestamp'
         elif is_datetime_key(key):
-            try:
-                parse(value, fuzzy=False)
+            if _try_parse_datetime(value) is not None:
                 return 'timestamp'
-            except ValueError as e:
+            else:
                 return 'text'
         else:
             return 'text'
 
 
+def _format_text(x):
+    return x
+
+
+METADATA_TYPE_FORMATTERS: Dict[str, Callable[[Any], Any]] = {
+    'text': _format_text,
+    'timestamp': format_datetime,
+    'int': int,
+    'float': float
+}
+
+
 def formatter_for_type(type_name: str) -> Callable[[Any], str]:
     """
     Determines and returns a specific formatter function based on the input type name. This formatter function is used
@@ -115,16 +159,10 @@ def formatter_for_type(type_name: str) -> Callable[[Any], str]:
     Raises:
         ValueError: If the type_name is not supported.
     """
-    if type_name == 'text':
-        return lambda x: x
-    elif type_name == 'timestamp':
-        return lambda x: format_datetime(x)
-    elif type_name == 'int':
-        return lambda x: int(x)
-    elif type_name == 'float':
-        return lambda x: float(x)
-    else:
+    formatter = METADATA_TYPE_FORMATTERS.get(type_name)
+    if formatter is None:
         raise ValueError(f'Unsupported type name: {type_name}')
+    return formatter
 
 
 class SourceMetadataFormatter(BaseModel):
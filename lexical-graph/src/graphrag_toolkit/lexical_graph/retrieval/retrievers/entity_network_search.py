@@ -6,6 +6,7 @@ import time
 import concurrent.futures
 from typing import List, Optional, Type
 
+from graphrag_toolkit.lexical_graph import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.retrieval.model import SearchResultCollection
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore
@@ -104,16 +105,33 @@ class EntityNetworkSearch(TraversalBasedBaseRetriever):
         
         return node_ids
 
+    def _get_node_ids_batch(self, query_bundles: List[QueryBundle]) -> List[str]:
+
+        index_name = self.index_name
+        id_name = f'{index_name}Id'
+
+        top_k_results = self.vector_store.get_index(index_name).top_k_batch(query_bundles)
+        node_ids = [result[index_name][id_name] for results in top_k_results for result in results]
+        
+        return node_ids
+
     def get_start_node_ids(self, query_bundle: QueryBundle) -> List[str]:
 
         start = time.time()
             
-        all_start_node_ids = self._get_node_ids(query_bundle)
-        
         entity_context_strs = self._get_entity_context_strings()
 
-        for entity_context_str in entity_context_strs:
-            all_start_node_ids.extend(self._get_node_ids(QueryBundle(query_str=entity_context_str)))
+        query_bundles = [query_bundle] + [
+            QueryBundle(query_str=entity_context_str) 
+            for entity_context_str in entity_context_strs
+        ]
+
+        if GraphRAGConfig.vector_query_batching_enabled:
+            all_start_node_ids = self._get_node_ids_batch(query_bundles)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(query_bundles), self.args.num_workers)) as p:
+                node_id_lists = p.map(self._get_node_ids, query_bundles)
+                all_start_node_ids = [node_id for node_ids in node_id_lists for node_id in node_ids]
 
         start_node_ids = list(set(all_start_node_ids))
 
@@ -1,7 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from .graph_store import GraphStore, RedactedGraphQueryLogFormatting, NonRedactedGraphQueryLogFormatting, NodeId, get_log_formatting, format_id
+from .graph_store import GraphStore, RedactedGraphQueryLogFormatting, NonRedactedGraphQueryLogFormatting, NodeId, get_log_formatting, format_id, format_query_with_query_ref
 from .graph_store_factory_method import GraphStoreFactoryMethod
 from .multi_tenant_graph_store import MultiTenantGraphStore
 from .dummy_graph_store import DummyGraphStore
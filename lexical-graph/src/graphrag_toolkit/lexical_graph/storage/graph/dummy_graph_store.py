@@ -22,6 +22,8 @@ class DummyGraphStoreFactory(GraphStoreFactoryMethod):
     Attributes:
         No additional class attributes are explicitly defined beyond inherited attributes.
     """
+    prefixes = (DUMMY,)
+
     def try_create(self, graph_info: str, **kwargs) -> GraphStore:
         """
         Attempts to create a `GraphStore` instance based on the provided `graph_info`.
@@ -43,7 +43,7 @@ def get_log_formatting(args):
         raise ValueError('log_formatting must be of type GraphQueryLogFormatting')
     return log_formatting
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NodeId:
     """
     Represents an identifier node with key-value pair attributes.
@@ -51,6 +51,7 @@ class NodeId:
     This class encapsulates a node identifier consisting of a key, value, and an
     optional flag to determine if the identifier is based on properties. It can
     be used to represent nodes with unique identifiers in various contexts.
+    Instances are immutable, so they can be safely shared and cached.
 
     Attributes:
         key (str): The key associated with the node identifier.
@@ -87,6 +88,19 @@ def format_id(id_name:str):
     else:
         return NodeId(parts[1], id_name)
 
+def format_query_with_query_ref(query_ref:str, q:str) -> str:
+    """
+    Prefixes a query with a comment containing the given query reference.
+
+    Args:
+        query_ref (str): The query reference to embed in the query.
+        q (str): The query to be formatted.
+
+    Returns:
+        str: The query, prefixed with a `//query_ref` comment line.
+    """
+    return f'//query_ref: {query_ref}\n{q}'
+
 @dataclass
 class GraphQueryLogEntryParameters:
     """
@@ -120,7 +134,7 @@ class GraphQueryLogEntryParameters:
             A formatted string containing the query reference prefixed to the
             original query.
         """
-        return f'//query_ref: {self.query_ref}\n{q}'
+        return format_query_with_query_ref(self.query_ref, q)
 
 class GraphQueryLogFormatting(BaseModel):
     """
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import abc
+from typing import Tuple
 
 from graphrag_toolkit.lexical_graph.storage.graph.graph_store import GraphStore
 
@@ -14,11 +15,18 @@ class GraphStoreFactoryMethod():
     subclasses, specifying how `GraphStore` objects are instantiated based on
     graph configuration details.
 
+    Attributes:
+        prefixes (Tuple[str, ...]): Connection string prefixes (e.g. `'neptune-graph://'`)
+            handled by this factory. `GraphStoreFactory` uses these to dispatch directly
+            to the factory; factories with no prefixes are tried in registration order.
+
     Methods:
         try_create(graph_info, **kwargs): Abstract method to attempt the creation
             of a `GraphStore` instance based on provided graph configuration
             and optional parameters.
     """
+    prefixes:Tuple[str, ...] = ()
+
     @abc.abstractmethod
     def try_create(self, graph_info:str, **kwargs) -> GraphStore:
         """
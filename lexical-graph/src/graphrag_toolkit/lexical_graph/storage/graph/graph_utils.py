@@ -3,15 +3,21 @@
 
 import re
 import string
-from typing import Any, List, Optional, Callable
+from lru import LRU
+from typing import Any, Dict, List, Optional, Callable, Hashable, Tuple
 import uuid
+from datetime import date
 
+from graphrag_toolkit.lexical_graph import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig, type_name_for_key_value, format_datetime
 from graphrag_toolkit.lexical_graph.storage.graph.graph_store import NodeId
 
 from llama_index.core.vector_stores.types import FilterCondition, FilterOperator, MetadataFilter, MetadataFilters
 
 SEARCH_STRING_PATTERN = re.compile(r'([^\s\w]|_)+')
+OPENCYPHER_FILTER_CACHE_SIZE = 256
+
+_opencypher_filter_cache = LRU(OPENCYPHER_FILTER_CACHE_SIZE)
 
 def new_query_var():
     return f'n{uuid.uuid4().hex}'
@@ -110,6 +116,40 @@ def node_result(node_ref:str,
         
     return f'{key}: {node_ref}{{{", ".join(property_selectors)}}}'
 
+def _default_value_formatter(x):
+    return x
+
+def _format_text(x):
+    return f"'{x}'"
+
+def _format_timestamp(x):
+    return f"datetime('{format_datetime(x)}')"
+
+OPENCYPHER_OPERATORS = {
+    FilterOperator.EQ: ('=', _default_value_formatter), 
+    FilterOperator.GT: ('>', _default_value_formatter), 
+    FilterOperator.LT: ('<', _default_value_formatter), 
+    FilterOperator.NE: ('<>', _default_value_formatter), 
+    FilterOperator.GTE: ('>=', _default_value_formatter), 
+    FilterOperator.LTE: ('<=', _default_value_formatter), 
+    #FilterOperator.IN: ('in', _default_value_formatter),  # In array (string or number)
+    #FilterOperator.NIN: ('nin', _default_value_formatter),  # Not in array (string or number)
+    #FilterOperator.ANY: ('any', _default_value_formatter),  # Contains any (array of strings)
+    #FilterOperator.ALL: ('all', _default_value_formatter),  # Contains all (array of strings)
+    FilterOperator.TEXT_MATCH: ('CONTAINS', _default_value_formatter),
+    FilterOperator.TEXT_MATCH_INSENSITIVE: ('CONTAINS', str.lower),
+    #FilterOperator.CONTAINS: ('contains', _default_value_formatter),  # metadata array contains value (string or number)
+    FilterOperator.IS_EMPTY: ('IS NULL', _default_value_formatter),  # the field is not exist or empty (null or empty array)
+}
+
+OPENCYPHER_TYPE_FORMATTERS = {
+    'text': _format_text,
+    'timestamp': _format_timestamp,
+    'number': _default_value_formatter,
+    'int': _default_value_formatter,
+    'float': _default_value_formatter
+}
+
 def to_opencypher_operator(operator: FilterOperator) -> tuple[str, Callable[[Any], str]]:
     """
     Converts a given filter operator into its corresponding OpenCypher operator and value formatter.
@@ -133,29 +173,10 @@ def to_opencypher_operator(operator: FilterOperator) -> tuple[str, Callable[[Any
     Raises:
         ValueError: If the provided operator is not supported.
     """
-    default_value_formatter = lambda x: x
-    
-    operator_map = {
-        FilterOperator.EQ: ('=', default_value_formatter), 
-        FilterOperator.GT: ('>', default_value_formatter), 
-        FilterOperator.LT: ('<', default_value_formatter), 
-        FilterOperator.NE: ('<>', default_value_formatter), 
-        FilterOperator.GTE: ('>=', default_value_formatter), 
-        FilterOperator.LTE: ('<=', default_value_formatter), 
-        #FilterOperator.IN: ('in', default_value_formatter),  # In array (string or number)
-        #FilterOperator.NIN: ('nin', default_value_formatter),  # Not in array (string or number)
-        #FilterOperator.ANY: ('any', default_value_formatter),  # Contains any (array of strings)
-        #FilterOperator.ALL: ('all', default_value_formatter),  # Contains all (array of strings)
-        FilterOperator.TEXT_MATCH: ('CONTAINS', default_value_formatter),
-        FilterOperator.TEXT_MATCH_INSENSITIVE: ('CONTAINS', lambda x: x.lower()),
-        #FilterOperator.CONTAINS: ('contains', default_value_formatter),  # metadata array contains value (string or number)
-        FilterOperator.IS_EMPTY: ('IS NULL', default_value_formatter),  # the field is not exist or empty (null or empty array)
-    }
-
-    if operator not in operator_map:
+    operator_mapping = OPENCYPHER_OPERATORS.get(operator)
+    if operator_mapping is None:
         raise ValueError(f'Unsupported filter operator: {operator}')
-    
-    return operator_map[operator]
+    return operator_mapping
 
 def formatter_for_type(type_name:str) -> Callable[[Any], str]:
     """
@@ -178,24 +199,137 @@ def formatter_for_type(type_name:str) -> Callable[[Any], str]:
     Raises:
         ValueError: If an unsupported type name is provided.
     """
-    if type_name == 'text':
-        return lambda x: f"'{x}'"
-    elif type_name == 'timestamp':
-        return lambda x: f"datetime('{format_datetime(x)}')"
-    elif type_name in ['number', 'int', 'float']:
-        return lambda x:x
-    else:
+    type_formatter = OPENCYPHER_TYPE_FORMATTERS.get(type_name)
+    if type_formatter is None:
         raise ValueError(f'Unsupported type name: {type_name}')
+    return type_formatter
+
+def _metadata_filter_to_opencypher_filter(f: MetadataFilter) -> str:
+    """
+    Converts a single `MetadataFilter` into an OpenCypher filter expression on the
+    corresponding `source` property.
+
+    Args:
+        f (MetadataFilter): The filter to be converted.
+
+    Returns:
+        str: The OpenCypher filter expression for the filter.
+    """
+    key = f'source.{f.key}'
+    (operator, operator_formatter) = to_opencypher_operator(f.operator)
+
+    if f.operator == FilterOperator.IS_EMPTY:
+        return f'({key} {operator})'
+    
+    type_formatter = formatter_for_type(type_name_for_key_value(f.key, f.value))
+    value = type_formatter(operator_formatter(str(f.value)))
+    
+    if f.operator == FilterOperator.TEXT_MATCH_INSENSITIVE:
+        return f'({key}.toLower() {operator} {value})'
+    else:
+        return f'({key} {operator} {value})'
+
+def _opencypher_parameter_value(f: MetadataFilter, type_name:str, operator_formatter:Callable[[Any], str]) -> Any:
+    if type_name == 'timestamp':
+        return format_datetime(operator_formatter(str(f.value)))
+    elif type_name == 'text':
+        return operator_formatter(str(f.value))
+    else:
+        return f.value
+
+def _metadata_filter_to_parameterized_opencypher_filter(f: MetadataFilter, params:Dict[str, Any], param_prefix:str, bindings:Optional[List[Tuple]]=None) -> str:
+    """
+    Converts a single `MetadataFilter` into an OpenCypher filter expression on the
+    corresponding `source` property, binding the filter value as a query parameter.
+
+    Args:
+        f (MetadataFilter): The filter to be converted.
+        params (Dict[str, Any]): The parameters dictionary to which the filter value is added.
+        param_prefix (str): The prefix used to name the filter value parameter.
+        bindings (Optional[List[Tuple]]): If supplied, a `(param_name, type_name, operator_formatter)`
+            tuple describing how the filter value was bound is appended to this list.
+
+    Returns:
+        str: The OpenCypher filter expression for the filter.
+    """
+    key = f'source.{f.key}'
+    (operator, operator_formatter) = to_opencypher_operator(f.operator)
+
+    if f.operator == FilterOperator.IS_EMPTY:
+        if bindings is not None:
+            bindings.append((None, None, None))
+        return f'({key} {operator})'
+    
+    param_name = f'{param_prefix}{len(params)}'
+    type_name = type_name_for_key_value(f.key, f.value)
+
+    params[param_name] = _opencypher_parameter_value(f, type_name, operator_formatter)
+    if bindings is not None:
+        bindings.append((param_name, type_name, operator_formatter))
+    
+    if type_name == 'timestamp':
+        value = f'datetime(${param_name})'
+    else:
+        value = f'${param_name}'
+    
+    if f.operator == FilterOperator.TEXT_MATCH_INSENSITIVE:
+        return f'({key}.toLower() {operator} {value})'
+    else:
+        return f'({key} {operator} {value})'
+
+def _append_opencypher_filters(metadata_filters:MetadataFilters, tokens:List[str], to_opencypher_filter:Callable[[MetadataFilter], str]=_metadata_filter_to_opencypher_filter):
+    """
+    Appends the tokens of the OpenCypher filter expression for a `MetadataFilters`
+    structure to the supplied list, descending into nested filters.
+
+    Args:
+        metadata_filters (MetadataFilters): The filter structure to be converted.
+        tokens (List[str]): The list to which the expression tokens are appended.
+        to_opencypher_filter (Callable[[MetadataFilter], str]): The function used to
+            convert individual filters.
+
+    Raises:
+        ValueError: If the metadata filter structure contains unexpected or invalid
+            types, or if an unsupported filter condition is encountered.
+    """
+    condition = metadata_filters.condition
+
+    if condition == FilterCondition.NOT:
+        tokens.append('(NOT ')
+        separator = ' '
+    elif condition == FilterCondition.AND or condition == FilterCondition.OR:
+        tokens.append('(')
+        separator = f' {condition.value.upper()} '
+    else:
+        separator = None
+
+    for i, metadata_filter in enumerate(metadata_filters.filters):
+        if i and separator:
+            tokens.append(separator)
+        if isinstance(metadata_filter, MetadataFilter):
+            if condition == FilterCondition.NOT:
+                raise ValueError(f'Expected MetadataFilters for FilterCondition.NOT, but found MetadataFilter')
+            tokens.append(to_opencypher_filter(metadata_filter))
+        elif isinstance(metadata_filter, MetadataFilters):
+            _append_opencypher_filters(metadata_filter, tokens, to_opencypher_filter)
+        else:
+            raise ValueError(f'Invalid metadata filter type: {type(metadata_filter)}')
+        
+    if separator is None:
+        raise ValueError(f'Unsupported filters condition: {condition}')
+    
+    tokens.append(')')
 
 def parse_metadata_filters_recursive(metadata_filters:MetadataFilters) -> str:
     """
     Parses a `MetadataFilters` object into an OpenCypher filter string.
 
-    This function recursively processes `MetadataFilters` and `MetadataFilter` objects
-    to construct a representation suitable for OpenCypher query language based on
-    filter conditions ('AND', 'OR', 'NOT') and operator transformations. The resulting
-    string can be directly incorporated into OpenCypher queries for filtering nodes
-    or relationships.
+    This function processes `MetadataFilters` and `MetadataFilter` objects, including
+    nested filters, to construct a representation suitable for OpenCypher query language
+    based on filter conditions ('AND', 'OR', 'NOT') and operator transformations. The
+    expression is assembled from a single list of tokens joined once at the end. The
+    resulting string can be directly incorporated into OpenCypher queries for filtering
+    nodes or relationships.
 
     Args:
         metadata_filters (MetadataFilters): The filter structure to be parsed, which
@@ -210,77 +344,64 @@ def parse_metadata_filters_recursive(metadata_filters:MetadataFilters) -> str:
         ValueError: If the metadata filter structure contains unexpected or invalid
             types, or if an unsupported filter condition is encountered.
     """
-    def to_key(key: str) -> str:
-        """
-        Recursively parses metadata filters and converts them into a formatted string.
+    tokens = []
+    _append_opencypher_filters(metadata_filters, tokens)
+    return ''.join(tokens)
 
-        This function takes a MetadataFilters object and iteratively processes it,
-        transforming its content into a specific string format for further usage.
 
-        Args:
-            metadata_filters: The MetadataFilters object that contains the filtering
-                criteria to be processed.
+def _freeze_metadata_filters(metadata_filters:MetadataFilters) -> Hashable:
+    """
+    Converts a `MetadataFilters` tree into a nested tuple that can be used as a cache key.
 
-        Returns:
-            A string that represents the parsed and formatted metadata filters based
-            on the provided input.
+    Leaf values are keyed together with their type, so that values which compare equal
+    but format differently (e.g. `1` and `1.0`) produce different keys.
 
-        """
-        return f"source.{key}"
-    
-    def metadata_filter_to_opencypher_filter(f: MetadataFilter) -> str:
-        """
-        Parses a `MetadataFilters` object recursively into a string representation usable as an OpenCypher filter expression.
-
-        This function processes a given `MetadataFilters` object by iterating through its filters
-        and recursively transforming them into OpenCypher-compatible filter expressions. The helper
-        function `metadata_filter_to_opencypher_filter` ensures that each individual filter is properly
-        formatted based on its key, operator, and value.
-
-        Args:
-            metadata_filters (MetadataFilters): The metadata filters to be recursively parsed into an
-                OpenCypher-compatible string representation.
-
-        Returns:
-            str: The OpenCypher-compatible filter expression string after parsing the input
-                `MetadataFilters` object.
-        """
-        key = to_key(f.key)
-        (operator, operator_formatter) = to_opencypher_operator(f.operator)
-
-        if f.operator == FilterOperator.IS_EMPTY:
-            return f"({key} {operator})"
-        else:
-            type_name = type_name_for_key_value(f.key, f.value)
-            type_formatter = formatter_for_type(type_name)
-            if f.operator == FilterOperator.TEXT_MATCH_INSENSITIVE:
-                return f"({key}.toLower() {operator} {type_formatter(operator_formatter(str(f.value)))})"
-            else:
-                return f"({key} {operator} {type_formatter(operator_formatter(str(f.value)))})"
- 
-    
-    condition = metadata_filters.condition.value
+    Args:
+        metadata_filters (MetadataFilters): The filter structure to be frozen.
 
-    filter_strs = []
+    Returns:
+        Hashable: A nested tuple describing the filter structure.
+    """
+    return (
+        metadata_filters.condition,
+        tuple(
+            _freeze_metadata_filters(f) if isinstance(f, MetadataFilters) 
+            else (f.key, f.operator, type(f.value), f.value) if isinstance(f, MetadataFilter)
+            else f
+            for f in metadata_filters.filters
+        )
+    )
+
+def _parameterized_filter_shape(metadata_filters:MetadataFilters, leaves:List[MetadataFilter]) -> Hashable:
+    """
+    Converts a `MetadataFilters` tree into a nested tuple describing the OpenCypher
+    produced for it when filter values are bound as parameters, and appends the tree's
+    `MetadataFilter` leaves, in parse order, to the supplied list.
 
-    for metadata_filter in metadata_filters.filters:
-        if isinstance(metadata_filter, MetadataFilter):
-            if metadata_filters.condition == FilterCondition.NOT:
-                raise ValueError(f'Expected MetadataFilters for FilterCondition.NOT, but found MetadataFilter')
-            filter_strs.append(metadata_filter_to_opencypher_filter(metadata_filter))
-        elif isinstance(metadata_filter, MetadataFilters):
-            filter_strs.append(parse_metadata_filters_recursive(metadata_filter))
-        else:
-            raise ValueError(f'Invalid metadata filter type: {type(metadata_filter)}')
-        
-    if metadata_filters.condition == FilterCondition.NOT:
-        return f"(NOT {' '.join(filter_strs)})"
-    elif metadata_filters.condition == FilterCondition.AND or metadata_filters.condition == FilterCondition.OR:
-        condition = f' {metadata_filters.condition.value.upper()} '
-        return f"({condition.join(filter_strs)})"
-    else:
-        raise ValueError(f'Unsupported filters condition: {metadata_filters.condition}')
+    Leaves are keyed by key, operator and inferred type name, but not by value, so
+    filters that differ only in their values share a key.
 
+    Args:
+        metadata_filters (MetadataFilters): The filter structure to be described.
+        leaves (List[MetadataFilter]): The list to which the filter leaves are appended.
+
+    Returns:
+        Hashable: A nested tuple describing the filter structure.
+
+    Raises:
+        ValueError: If a filter value is of an unsupported type.
+    """
+    shape = []
+    for f in metadata_filters.filters:
+        if isinstance(f, MetadataFilters):
+            shape.append(_parameterized_filter_shape(f, leaves))
+        elif isinstance(f, MetadataFilter):
+            leaves.append(f)
+            type_name = None if f.operator == FilterOperator.IS_EMPTY else type_name_for_key_value(f.key, f.value)
+            shape.append((f.key, f.operator, type_name))
+        else:
+            shape.append(f)
+    return (metadata_filters.condition, tuple(shape))
 
 def filter_config_to_opencypher_filters(filter_config:FilterConfig) -> str:
     """
@@ -292,6 +413,12 @@ def filter_config_to_opencypher_filters(filter_config:FilterConfig) -> str:
     configuration or its source filters are not provided, an empty string is
     returned.
 
+    Compiled filters are cached by the structure and values of the source filters,
+    together with the configured metadata datetime suffixes, so repeated queries with
+    equivalent filters do not re-parse the filter tree. The current date is part of
+    the cache key, because timestamp values without a date component are resolved
+    against today's date.
+
     Args:
         filter_config (FilterConfig): The configuration object containing source
             filters to be converted into OpenCypher format.
@@ -302,5 +429,109 @@ def filter_config_to_opencypher_filters(filter_config:FilterConfig) -> str:
     """
     if filter_config is None or filter_config.source_filters is None:
         return ''
-    return parse_metadata_filters_recursive(filter_config.source_filters)
-    
\ No newline at end of file
+    
+    try:
+        cache_key = (
+            _freeze_metadata_filters(filter_config.source_filters), 
+            tuple(GraphRAGConfig.metadata_datetime_suffixes),
+            date.today()
+        )
+        hash(cache_key)
+    except TypeError:
+        return parse_metadata_filters_recursive(filter_config.source_filters)
+
+    opencypher_filters = _opencypher_filter_cache.get(cache_key)
+    if opencypher_filters is None:
+        opencypher_filters = parse_metadata_filters_recursive(filter_config.source_filters)
+        _opencypher_filter_cache[cache_key] = opencypher_filters
+    return opencypher_filters
+    
+
+def filter_config_to_parameterized_opencypher_filters(filter_config:FilterConfig, param_prefix:str='filter') -> Tuple[str, Dict[str, Any]]:
+    """
+    Converts filter configuration into an OpenCypher filter string whose values are
+    bound as query parameters, together with the parameters to be passed with the query.
+
+    Filter values are referenced as `$<param_prefix>0`, `$<param_prefix>1`, etc. Filters
+    with the same structure therefore produce the same OpenCypher text, regardless of
+    their values, and values never need to be quoted or escaped. Compiled filters are
+    cached in the same way as `filter_config_to_opencypher_filters`. In addition, the
+    filter text and the way each value is bound are cached by the structure of the
+    filters without their values, so that filters which differ only in their values
+    reuse the compiled text and only have their parameters rebuilt. Parameter values
+    are always rebuilt from the current filter values, so partial timestamp values
+    are resolved against today's date.
+
+    Args:
+        filter_config (FilterConfig): The configuration object containing source
+            filters to be converted into OpenCypher format.
+        param_prefix (str, optional): The prefix used to name filter value parameters.
+            Defaults to 'filter'.
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: The OpenCypher formatted filters as a string, and the
+            filter value parameters. Returns an empty string and an empty dictionary if no
+            filters are provided.
+    """
+    if filter_config is None or filter_config.source_filters is None:
+        return '', {}
+    
+    def parse_filters(bindings=None):
+        tokens = []
+        params = {}
+        _append_opencypher_filters(
+            filter_config.source_filters, 
+            tokens, 
+            lambda f: _metadata_filter_to_parameterized_opencypher_filter(f, params, param_prefix, bindings)
+        )
+        return ''.join(tokens), params
+    
+    def compile_filters():
+        leaves = []
+        try:
+            shape_key = (
+                'parameterized_shape',
+                param_prefix,
+                _parameterized_filter_shape(filter_config.source_filters, leaves),
+                datetime_suffixes
+            )
+            hash(shape_key)
+        except (TypeError, ValueError):
+            return parse_filters()
+        
+        compiled = _opencypher_filter_cache.get(shape_key)
+        if compiled is None:
+            bindings = []
+            (opencypher_filters, params) = parse_filters(bindings)
+            _opencypher_filter_cache[shape_key] = (opencypher_filters, bindings)
+            return opencypher_filters, params
+        
+        (opencypher_filters, bindings) = compiled
+        params = {
+            param_name: _opencypher_parameter_value(f, type_name, operator_formatter)
+            for (param_name, type_name, operator_formatter), f in zip(bindings, leaves)
+            if param_name is not None
+        }
+        return opencypher_filters, params
+    
+    datetime_suffixes = tuple(GraphRAGConfig.metadata_datetime_suffixes)
+
+    try:
+        cache_key = (
+            'parameterized',
+            param_prefix,
+            _freeze_metadata_filters(filter_config.source_filters), 
+            datetime_suffixes,
+            date.today()
+        )
+        hash(cache_key)
+    except TypeError:
+        return parse_filters()
+
+    cached = _opencypher_filter_cache.get(cache_key)
+    if cached is None:
+        cached = compile_filters()
+        _opencypher_filter_cache[cache_key] = cached
+    
+    (opencypher_filters, params) = cached
+    return opencypher_filters, dict(params)
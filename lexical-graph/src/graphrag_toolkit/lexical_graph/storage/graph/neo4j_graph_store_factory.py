@@ -9,6 +9,8 @@ NEO4J_SCHEMES = ['bolt', 'bolt+ssc', 'bolt+s', 'neo4j', 'neo4j+ssc', 'neo4j+s']
 
 class Neo4jGraphStoreFactory(GraphStoreFactoryMethod):
 
+    prefixes = tuple(f'{scheme}://' for scheme in NEO4J_SCHEMES)
+
     def try_create(self, graph_info:str, **kwargs) -> GraphStore:
         endpoint_url = None
         for scheme in NEO4J_SCHEMES:
@@ -1,35 +1,33 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, List, Dict, Optional, Callable, Union, Iterable, Generator
+import concurrent.futures
+from typing import Any, List, Dict, Optional, Callable, Union, Iterable, Generator, Sequence, Tuple
+
+from graphrag_toolkit.lexical_graph import GraphRAGConfig
 
 def _default_params_adapter(v):
 
-    def _dedup(parameters:List):
-        params_map = {}
-        for p in parameters:
-            params_map[str(p).lower()] = p
-        return list(params_map.values())
+    def _dedup(parameters:Iterable):
+        return list({str(p).lower(): p for p in parameters}.values())
     
     if isinstance(v, dict):
         return v
-    if isinstance(v, list):
+    if isinstance(v, (list, Generator)):
         return {'params': _dedup(v)}
-    if isinstance(v, Generator):
-        params = _dedup([p for p in v])
-        return {'params':params}
     raise ValueError(f'Invalid input parameters. Expected list or dictionary, but received {type(v).__name__}.')
 
 DEFAULT_PARAMS_ADAPTER = _default_params_adapter
+NO_CHILD_QUERIES = ()
 
 class Query():
     def __init__(self, 
                  query:str, 
                  params_adapter:Optional[Callable[[Any], Dict]]=None,
-                 child_queries:Optional[List]=None):
+                 child_queries:Optional[Sequence['Query']]=None):
         self.query = query
         self.params_adapter = params_adapter or DEFAULT_PARAMS_ADAPTER
-        self.child_queries = child_queries or []
+        self.child_queries:Sequence[Query] = child_queries or NO_CHILD_QUERIES
 
 class Job():
     def __init__(self, query:Query, params:Any):
@@ -45,22 +43,80 @@ class QueryTree():
     def __init__(self, name:str, root_query:Query):
         self.id = f'query-tree-{name}'
         self.root_query = root_query
+
+    def _run_query(self, query:Query, params:Any, graph_store_fn:Callable[[str, Dict], List[Any]], materialize:bool=False) -> Iterable[Any]:
+        results = graph_store_fn(query.query, query.params_adapter(params))
+        # Child queries may re-read their parent's results, so only leaf results can be streamed
+        if materialize or query.child_queries:
+            return list(results)
+        return results
         
-    def run(self, params, graph_store_fn:Callable[[str, Dict], List[Any]]) -> Iterable[Any]:
-        
-        job_queue = []
-        
-        job = Job(self.root_query, params)
-        
-        while job:
-        
-            results = job.run(graph_store_fn)
-            
-            if job.query.child_queries:
-                for q in job.query.child_queries:
-                    job_queue.append(Job(q, results))
+    def _child_jobs(self, query:Query, results:Iterable[Any]) -> List[Tuple[Query, Any]]:
+        # The default adapter passes dicts through unchanged, so siblings using it can share one adapted copy
+        default_params = None
+        child_jobs = []
+        for q in query.child_queries:
+            if q.params_adapter is DEFAULT_PARAMS_ADAPTER:
+                if default_params is None:
+                    default_params = DEFAULT_PARAMS_ADAPTER(results)
+                child_jobs.append((q, default_params))
             else:
-                for r in results:
-                    yield r
-            
-            job = job_queue.pop() if job_queue else None
\ No newline at end of file
+                child_jobs.append((q, results))
+        return child_jobs
+
+    def run(self, params, graph_store_fn:Callable[[str, Dict], List[Any]], num_workers:Optional[int]=None) -> Iterable[Any]:
+        """
+        Runs the query tree depth-first, starting with the root query, and yields the
+        results of its leaf queries.
+
+        Child queries are run with their parent's results as parameters. The last child
+        of a query, and all of its descendants, are run before the child before it, and
+        leaf results are yielded in that order.
+
+        If `num_workers` (by default, `GraphRAGConfig.query_tree_num_workers`) is
+        greater than 1, child queries are submitted to a thread pool as soon as their
+        parent's results are available, so that sibling queries run concurrently
+        against the graph store. Results are still yielded in the same depth-first
+        order. An exception raised by any query is raised by this generator when that
+        query's results are reached, and queries that have not yet started are
+        cancelled.
+
+        Args:
+            params: The parameters for the root query.
+            graph_store_fn (Callable[[str, Dict], List[Any]]): The function used to run
+                each query with its parameters. It must be thread-safe if `num_workers`
+                is greater than 1.
+            num_workers (Optional[int]): The maximum number of queries run concurrently.
+
+        Returns:
+            Iterable[Any]: The results of the leaf queries.
+        """
+        if num_workers is None:
+            num_workers = GraphRAGConfig.query_tree_num_workers
+
+        if num_workers < 2:
+            job_stack = [(self.root_query, params)]
+            while job_stack:
+                (query, query_params) = job_stack.pop()
+                results = self._run_query(query, query_params, graph_store_fn)
+                if query.child_queries:
+                    job_stack.extend(self._child_jobs(query, results))
+                else:
+                    yield from results
+            return
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_workers)
+        try:
+            job_stack = [(self.root_query, executor.submit(self._run_query, self.root_query, params, graph_store_fn, True))]
+            while job_stack:
+                (query, future) = job_stack.pop()
+                results = future.result()
+                if query.child_queries:
+                    job_stack.extend(
+                        (q, executor.submit(self._run_query, q, p, graph_store_fn, True))
+                        for (q, p) in self._child_jobs(query, results)
+                    )
+                else:
+                    yield from results
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
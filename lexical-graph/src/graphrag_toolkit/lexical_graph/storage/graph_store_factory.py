@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Union, Type, Dict
+from typing import Union, Type, Dict, Optional
 
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore, GraphStoreFactoryMethod
 from graphrag_toolkit.lexical_graph.storage.graph.dummy_graph_store import DummyGraphStoreFactory
@@ -15,6 +15,15 @@ GraphStoreType = Union[str, GraphStore]
 GraphStoreFactoryMethodType = Union[GraphStoreFactoryMethod, Type[GraphStoreFactoryMethod]]
 
 _graph_store_factories:Dict[str, GraphStoreFactoryMethod] = { c.__name__ : c() for c in [NeptuneAnalyticsGraphStoreFactory, NeptuneDatabaseGraphStoreFactory, Neo4jGraphStoreFactory, DummyGraphStoreFactory] }
+_graph_store_factories_by_prefix:Dict[str, GraphStoreFactoryMethod] = { prefix : factory for factory in _graph_store_factories.values() for prefix in factory.prefixes }
+
+def _factory_for_prefix(graph_info:str) -> Optional[GraphStoreFactoryMethod]:
+    if not isinstance(graph_info, str):
+        return None
+    scheme_end = graph_info.find('://')
+    if scheme_end < 0:
+        return None
+    return _graph_store_factories_by_prefix.get(graph_info[:scheme_end + 3])
 
 
 class GraphStoreFactory():
@@ -38,7 +47,8 @@ class GraphStoreFactory():
         This method allows registration of classes inheriting from GraphStoreFactoryMethod
         or their instances. The input factory_type is checked for its validity as a subclass
         or instance of GraphStoreFactoryMethod. If this condition is met, the factory
-        type is added to the registry with its class name as the key.
+        type is added to the registry with its class name as the key, and indexed by each
+        of the factory's `prefixes` for direct dispatch.
 
         Args:
             factory_type (GraphStoreFactoryMethod | type): The factory type, which can either
@@ -52,12 +62,16 @@ class GraphStoreFactory():
         if isinstance(factory_type, type):
             if not issubclass(factory_type, GraphStoreFactoryMethod):
                 raise ValueError(f'Invalid factory_type argument: {factory_type.__name__} must inherit from GraphStoreFactoryMethod.')
-            _graph_store_factories[factory_type.__name__] = factory_type()
+            factory = factory_type()
+            _graph_store_factories[factory_type.__name__] = factory
         else:
             factory_type_name = type(factory_type).__name__
             if not isinstance(factory_type, GraphStoreFactoryMethod):
                 raise ValueError(f'Invalid factory_type argument: {factory_type_name} must inherit from GraphStoreFactoryMethod.')
-            _graph_store_factories[factory_type_name] = factory_type
+            factory = factory_type
+            _graph_store_factories[factory_type_name] = factory
+        for prefix in factory.prefixes:
+            _graph_store_factories_by_prefix[prefix] = factory
 
     @staticmethod
     def for_graph_store(graph_info:GraphStoreType=None, **kwargs) -> GraphStore:
@@ -68,8 +82,10 @@ class GraphStoreFactory():
         This method is responsible for initializing the GraphStore by either using
         the given `graph_info` directly (if it is an instance of `GraphStore`) or
         by utilizing the registered factory methods to create an appropriate
-        GraphStore instance. If factory creation is not successful, it raises a
-        `ValueError`.
+        GraphStore instance. The factory registered for the connection string's
+        prefix is tried first; if it does not create a graph store, the remaining
+        factories are tried in registration order. If factory creation is not
+        successful, it raises a `ValueError`.
 
         Args:
             graph_info (GraphStoreType, optional): Connection information or an
@@ -91,8 +107,16 @@ class GraphStoreFactory():
         """
         if graph_info and isinstance(graph_info, GraphStore):
             return graph_info
+
+        prefix_factory = _factory_for_prefix(graph_info)
+        if prefix_factory:
+            graph_store = prefix_factory.try_create(graph_info, **kwargs)
+            if graph_store:
+                return graph_store
         
         for factory in _graph_store_factories.values():
+            if factory is prefix_factory:
+                continue
             graph_store = factory.try_create(graph_info, **kwargs)
             if graph_store:
                 return graph_store
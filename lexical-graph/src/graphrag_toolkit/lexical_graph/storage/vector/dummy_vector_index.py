@@ -7,7 +7,6 @@ from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.storage.vector import VectorIndex, VectorIndexFactoryMethod
 
 from llama_index.core.schema import QueryBundle
-from llama_index.core.vector_stores.types import MetadataFilters
 
 
 DUMMY = 'dummy://'
@@ -26,6 +25,8 @@ class DummyVectorIndexFactory(VectorIndexFactoryMethod):
     Attributes:
         None
     """
+    prefixes = (DUMMY,)
+
     def try_create(self, index_names:List[str], vector_index_info:str, **kwargs) -> List[VectorIndex]:
         """
         Tries to create vector indexes based on the provided index names and vector index information.
@@ -73,7 +74,8 @@ class DummyVectorIndex(VectorIndex):
         Args:
             nodes (list): A list of node objects for which embeddings are to be added.
         """ 
-        logger.debug(f'[{self.index_name}] add embeddings for nodes: {[n.id_ for n in nodes]}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'[{self.index_name}] add embeddings for nodes: {[n.id_ for n in nodes]}')
         return nodes
     
     def top_k(self, query_bundle:QueryBundle, top_k:int=5, filter_config:Optional[FilterConfig]=None) -> Sequence[Any]:
@@ -93,7 +95,8 @@ class DummyVectorIndex(VectorIndex):
         Returns:
             Sequence[Any]: A sequence of top-ranked results matching the query and filter criteria.
         """
-        logger.debug(f'[{self.index_name}] top k query: {query_bundle.query_str}, top_k: {top_k}, filter_config: {filter_config}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'[{self.index_name}] top k query: {query_bundle.query_str}, top_k: {top_k}, filter_config: {filter_config}')
         return []
 
     def get_embeddings(self, ids:List[str]=[]) -> Sequence[Any]:
@@ -112,5 +115,6 @@ class DummyVectorIndex(VectorIndex):
             Sequence[Any]: A sequence of embeddings corresponding to the provided
             document IDs.
         """
-        logger.debug(f'[{self.index_name}] get embeddings for ids: {ids}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'[{self.index_name}] get embeddings for ids: {ids}')
         return []
@@ -0,0 +1,115 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.indices.utils import embed_nodes
+from llama_index.core.schema import BaseNode, MetadataMode
+
+CONTENT_DIGEST_SIZE = 16
+
+def _content_key(node:BaseNode) -> bytes:
+    content = node.get_content(metadata_mode=MetadataMode.EMBED)
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=CONTENT_DIGEST_SIZE).digest()
+
+class EmbeddingCache:
+    """
+    A thread-safe, size-bounded LRU cache of node embeddings keyed by a hash of the
+    content that is embedded.
+
+    Nodes whose embedding content has already been embedded by this cache's model,
+    or appears earlier in the same call, reuse that embedding; only the remaining
+    nodes are passed to `embed_nodes`. Nodes that already carry an embedding keep it.
+    Cached embeddings are shared rather than copied, so callers should not modify the
+    embeddings they receive.
+
+    Attributes:
+        embed_model (BaseEmbedding): The embedding model used to embed cache misses.
+        max_size (int): The maximum number of embeddings held by the cache.
+        hits (int): The number of nodes whose embedding was served from the cache.
+        misses (int): The number of nodes embedded by the embedding model.
+    """
+    def __init__(self, embed_model:BaseEmbedding, max_size:int):
+        self.embed_model = embed_model
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries:OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed_nodes(self, nodes:Sequence[BaseNode]) -> Dict[str, List[float]]:
+        """
+        Returns a map of node id to embedding for the given nodes, embedding only
+        those nodes whose content is not already cached.
+
+        Args:
+            nodes (Sequence[BaseNode]): The nodes to embed.
+
+        Returns:
+            Dict[str, List[float]]: The embedding of each node, keyed by node id.
+        """
+        id_to_embed_map = {}
+        uncached_nodes = {}
+        duplicate_nodes = []
+
+        with self._lock:
+            for node in nodes:
+                if node.embedding is not None:
+                    id_to_embed_map[node.node_id] = node.embedding
+                    continue
+                key = _content_key(node)
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                    id_to_embed_map[node.node_id] = embedding
+                    self.hits += 1
+                elif key in uncached_nodes:
+                    duplicate_nodes.append((node, key))
+                    self.hits += 1
+                else:
+                    uncached_nodes[key] = node
+                    self.misses += 1
+
+        if uncached_nodes:
+            uncached_embed_map = embed_nodes(list(uncached_nodes.values()), self.embed_model)
+            with self._lock:
+                for key, node in uncached_nodes.items():
+                    embedding = uncached_embed_map[node.node_id]
+                    id_to_embed_map[node.node_id] = embedding
+                    self._entries[key] = embedding
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        for node, key in duplicate_nodes:
+            id_to_embed_map[node.node_id] = id_to_embed_map[uncached_nodes[key].node_id]
+
+        return id_to_embed_map
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+def embed_nodes_with_cache(nodes:Sequence[BaseNode], embed_model:BaseEmbedding, embedding_cache:Optional[EmbeddingCache]=None) -> Dict[str, List[float]]:
+    """
+    Embeds the given nodes, serving repeated content from the embedding cache if one
+    is supplied, and falling back to `embed_nodes` otherwise.
+
+    Args:
+        nodes (Sequence[BaseNode]): The nodes to embed.
+        embed_model (BaseEmbedding): The embedding model used when no cache is supplied.
+        embedding_cache (Optional[EmbeddingCache]): An optional embedding cache.
+
+    Returns:
+        Dict[str, List[float]]: The embedding of each node, keyed by node id.
+    """
+    if embedding_cache is None:
+        return embed_nodes(nodes, embed_model)
+    return embedding_cache.embed_nodes(nodes)
@@ -21,19 +21,21 @@ class MultiTenantVectorStore(VectorStore):
     @classmethod
     def wrap(cls, vector_store:VectorStore, tenant_id:TenantId):
         """
-        Wraps the given vector_store with a MultiTenantVectorStore if necessary, based on the
-        tenant_id provided. The method ensures that the given vector_store is returned as-is
-        if it corresponds to the default tenant or is already an instance of
-        MultiTenantVectorStore. Otherwise, it wraps the vector_store inside a
-        MultiTenantVectorStore with the given tenant_id.
+        Wraps the given vector_store with a MultiTenantVectorStore unless it is already an
+        instance of MultiTenantVectorStore, in which case it is returned as-is.
+
+        Stores for the default tenant are wrapped too. Index instances are shared
+        between wrappers, and each wrapper sets its tenant on an index whenever it is
+        retrieved, so an unwrapped store could otherwise query with another tenant's
+        label.
 
         Args:
             vector_store: The vector_store to wrap if required.
             tenant_id: The tenant identifier used to decide whether wrapping is necessary.
 
         Returns:
-            The provided vector_store, wrapped in a MultiTenantVectorStore if necessary, or
-            the vector_store itself if no wrapping is required.
+            The provided vector_store, wrapped in a MultiTenantVectorStore if it is not
+            one already.
         """
         
         if isinstance(vector_store, MultiTenantVectorStore):
@@ -47,6 +49,9 @@ class MultiTenantVectorStore(VectorStore):
         """
         Retrieves an index from the inner object and associates it with the tenant ID.
 
+        The index is looked up in the inner store on every call, so changes to the
+        inner store's indexes are always picked up.
+
         Args:
             index_name: Name of the index to retrieve.
 
@@ -69,4 +74,3 @@ class MultiTenantVectorStore(VectorStore):
             inner indexes of the current instance.
         """
         return [self.get_index(i) for i in self.inner.indexes.keys()]
-        
\ No newline at end of file
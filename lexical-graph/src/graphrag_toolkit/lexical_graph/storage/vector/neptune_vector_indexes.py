@@ -1,31 +1,105 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import string
+import sys
 import logging
-from typing import Any, List, Optional
+import threading
+from lru import LRU
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
 from graphrag_toolkit.lexical_graph.storage import GraphStoreFactory
 from graphrag_toolkit.lexical_graph.storage.graph import GraphStore, MultiTenantGraphStore
-from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import node_result, filter_config_to_opencypher_filters
+from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import node_result, filter_config_to_parameterized_opencypher_filters
 from graphrag_toolkit.lexical_graph.storage.graph.neptune_graph_stores import NeptuneAnalyticsClient
 from graphrag_toolkit.lexical_graph.storage.vector import VectorIndex, VectorIndexFactoryMethod, to_embedded_query
+from graphrag_toolkit.lexical_graph.storage.vector.query_result_cache import QueryResultCache
+from graphrag_toolkit.lexical_graph.storage.vector.embedding_cache import EmbeddingCache, embed_nodes_with_cache
 
-from llama_index.core.indices.utils import embed_nodes
+from llama_index.core.utils import iter_batch
 from llama_index.core.schema import QueryBundle
+from llama_index.core.bridge.pydantic import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
 NEPTUNE_ANALYTICS = 'neptune-graph://'
+CYPHER_CACHE_SIZE = 64
+DEFAULT_TOP_K_OVERFETCH_FACTOR = 5
+DEFAULT_UPSERT_BATCH_SIZE = 100
+GET_EMBEDDINGS_BATCH_SIZE = 500
+GET_EMBEDDINGS_MAX_WORKERS = 4
+
+def _chunk_return_fields(neptune_client:GraphStore) -> str:
+    return f"source:{{sourceId: {neptune_client.node_id('source.sourceId')}, {node_result('source', key_name='metadata')}}},\n{node_result('chunk', neptune_client.node_id('chunk.chunkId'), [])}"
+
+def _default_return_fields(index_name:str):
+    return lambda neptune_client: node_result(index_name, neptune_client.node_id(f'{index_name}.{index_name}Id'))
+
+_return_fields_cache:Dict[Any, str] = {}
+
+_top_k_result_cache:Optional[QueryResultCache] = None
+_top_k_result_cache_versions:Dict[Tuple[str, str], int] = {}
+_top_k_result_cache_lock = threading.Lock()
+
+def _shared_top_k_result_cache() -> Optional[QueryResultCache]:
+    global _top_k_result_cache
+    cache_size = GraphRAGConfig.vector_query_cache_size
+    if cache_size <= 0:
+        return None
+    ttl_seconds = GraphRAGConfig.vector_query_cache_ttl_seconds
+    with _top_k_result_cache_lock:
+        cache = _top_k_result_cache
+        if cache is None or cache.max_size != cache_size or cache.ttl_seconds != ttl_seconds:
+            cache = QueryResultCache(max_size=cache_size, ttl_seconds=ttl_seconds)
+            _top_k_result_cache = cache
+        return cache
+
+def _top_k_result_cache_version(index_key:Tuple[str, str]) -> int:
+    return _top_k_result_cache_versions.get(index_key, 0)
+
+def _invalidate_top_k_results(index_key:Tuple[str, str]):
+    # entries keyed by an earlier version are never read again, and age out of the LRU
+    with _top_k_result_cache_lock:
+        _top_k_result_cache_versions[index_key] = _top_k_result_cache_version(index_key) + 1
+
+def _return_fields_for(index_name:str, neptune_client:GraphStore) -> str:
+    cache_key = (index_name, type(neptune_client))
+    return_fields = _return_fields_cache.get(cache_key)
+    if return_fields is None:
+        return_fields = _INDEX_SPECS[index_name]['return_fields'](neptune_client)
+        _return_fields_cache[cache_key] = return_fields
+    return return_fields
+
+_INDEX_SPECS = {
+    'chunk': {
+        'label': '__Chunk__',
+        'path': '(chunk)-[:`__EXTRACTED_FROM__`]->(source:`__Source__`)',
+        'return_fields': _chunk_return_fields
+    },
+    'statement': {
+        'label': '__Statement__',
+        'path': '(statement)-[:`__MENTIONED_IN__`]->(:`__Chunk__`)-[:`__EXTRACTED_FROM__`]->(source:`__Source__`)',
+        'return_fields': _default_return_fields('statement')
+    },
+    'topic': {
+        'label': '__Topic__',
+        'path': '(topic)-[:`__MENTIONED_IN__`]->(:`__Chunk__`)-[:`__EXTRACTED_FROM__`]->(source:`__Source__`)',
+        'return_fields': _default_return_fields('topic')
+    }
+}
     
 class NeptuneAnalyticsVectorIndexFactory(VectorIndexFactoryMethod):
+    prefixes = (NEPTUNE_ANALYTICS,)
+
     def try_create(self, index_names:List[str], vector_index_info:str, **kwargs) -> List[VectorIndex]:
         """
         Attempts to create a list of vector indices based on the given index names and vector index
         information. If the vector index information specifies a Neptune Analytics configuration,
-        the function initializes Neptune indices for each index name. Otherwise, it returns None.
+        the function initializes Neptune indices for each index name, sharing a single Neptune
+        Analytics client between them. Otherwise, it returns None.
 
         Args:
             index_names (List[str]): A list of names for the indices to attempt creation.
@@ -41,7 +115,8 @@ class NeptuneAnalyticsVectorIndexFactory(VectorIndexFactoryMethod):
         if vector_index_info.startswith(NEPTUNE_ANALYTICS):
             graph_id = vector_index_info[len(NEPTUNE_ANALYTICS):]
             logger.debug(f'Opening Neptune Analytics vector indexes [index_names: {index_names}, graph_id: {graph_id}]')
-            return [NeptuneIndex.for_index(index_name, vector_index_info, **kwargs) for index_name in index_names]
+            neptune_client = GraphStoreFactory.for_graph_store(vector_index_info, **kwargs)
+            return [NeptuneIndex.for_index(index_name, neptune_client, **kwargs) for index_name in index_names]
         else:
             return None
 
@@ -66,6 +141,10 @@ class NeptuneIndex(VectorIndex):
         path (str): The traversal path defined for the index queries.
         return_fields (str): The fields to return when executing queries related to the
             index.
+        overfetch_factor (int): The multiple of top_k candidates requested from the vector
+            index, allowing for candidates removed by the tenant and metadata filters.
+        upsert_batch_size (int): The maximum number of embeddings upserted by a single
+            query in add_embeddings.
     """
     @staticmethod
     def for_index(index_name, graph_id, embed_model=None, dimensions=None, **kwargs):
@@ -80,8 +159,8 @@ class NeptuneIndex(VectorIndex):
         Args:
             index_name (str): The name of the index to be configured. Must be a valid
                 index name.
-            graph_id (str): The identifier for the graph database for which the index
-                is created.
+            graph_id (str | GraphStore): The identifier for the graph database for which
+                the index is created, or an existing graph store to reuse.
             embed_model (Optional[Any]): Embedding model to be used for the index. If
                 not specified, a default model from `GraphRAGConfig` is used.
             dimensions (Optional[int]): The dimensionality of embeddings. Uses default
@@ -96,24 +175,18 @@ class NeptuneIndex(VectorIndex):
         Raises:
             ValueError: If the provided `index_name` is invalid or unrecognized.
         """
-        index_name = index_name.lower()
+        index_name = sys.intern(index_name.lower())
+        index_spec = _INDEX_SPECS.get(index_name)
+        if index_spec is None:
+            raise ValueError(f'Invalid index name: {index_name}')
+
         neptune_client:GraphStore = GraphStoreFactory.for_graph_store(graph_id, **kwargs)
         embed_model = embed_model or GraphRAGConfig.embed_model
         dimensions = dimensions or GraphRAGConfig.embed_dimensions
-        id_name = f'{index_name}Id'
-        label = f'__{string.capwords(index_name)}__' 
-        path = f'({index_name})'
-        return_fields = node_result(index_name, neptune_client.node_id(f'{index_name}.{id_name}'))
-
-        if index_name == 'chunk':
-            path = '(chunk)-[:`__EXTRACTED_FROM__`]->(source:`__Source__`)'
-            return_fields = f"source:{{sourceId: {neptune_client.node_id('source.sourceId')}, {node_result('source', key_name='metadata')}}},\n{node_result('chunk', neptune_client.node_id('chunk.chunkId'), [])}"
-        elif index_name == 'statement':
-            path = '(statement)-[:`__MENTIONED_IN__`]->(:`__Chunk__`)-[:`__EXTRACTED_FROM__`]->(source:`__Source__`)'
-        elif index_name == 'topic':
-            path = '(topic)-[:`__MENTIONED_IN__`]->(:`__Chunk__`)-[:`__EXTRACTED_FROM__`]->(source:`__Source__`)'
-        else:
-            raise ValueError(f'Invalid index name: {index_name}')
+        id_name = sys.intern(f'{index_name}Id')
+        label = index_spec['label']
+        path = index_spec['path']
+        return_fields = _return_fields_for(index_name, neptune_client)
             
         return NeptuneIndex(
             index_name=index_name,
@@ -123,7 +196,8 @@ class NeptuneIndex(VectorIndex):
             id_name=id_name,
             label=label,
             path=path,
-            return_fields=return_fields
+            return_fields=return_fields,
+            overfetch_factor=GraphRAGConfig.vector_query_overfetch_factor
         ) 
 
 
@@ -134,6 +208,68 @@ class NeptuneIndex(VectorIndex):
     label: str
     path: str
     return_fields: str
+    overfetch_factor: int = DEFAULT_TOP_K_OVERFETCH_FACTOR
+    upsert_batch_size: int = DEFAULT_UPSERT_BATCH_SIZE
+
+    _cypher_cache: Any = PrivateAttr(default_factory=lambda: LRU(CYPHER_CACHE_SIZE))
+    _tenant_clients: Dict[str, GraphStore] = PrivateAttr(default_factory=dict)
+    _node_embedding_cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+
+    def __getstate__(self):
+        """
+        Serializes the current state of the object while excluding the Cypher cache,
+        the tenant-wrapped clients and the embedding cache.
+
+        The Cypher cache is not picklable. These attributes are left out of the
+        serialized state, rather than reset on this instance, and are recreated
+        empty when the object is deserialized, so that indexes can be passed to
+        build pipeline worker processes.
+
+        Returns:
+            dict: The serialized state of the object.
+        """
+        state = super().__getstate__()
+        state['__pydantic_private__'] = {
+            **(state.get('__pydantic_private__') or {}),
+            '_cypher_cache': None,
+            '_tenant_clients': {},
+            '_node_embedding_cache': None
+        }
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._cypher_cache = LRU(CYPHER_CACHE_SIZE)
+
+    def _tenant_label(self) -> str:
+        cache_key = ('tenant_label', self.tenant_id.value)
+        tenant_label = self._cypher_cache.get(cache_key)
+        if tenant_label is None:
+            tenant_label = self.tenant_id.format_label(self.label).replace('`', '')
+            self._cypher_cache[cache_key] = tenant_label
+        return tenant_label
+
+    def _index_text_affixes(self) -> Tuple[str, str]:
+        cache_key = ('index_text_affixes', self.tenant_id.value)
+        affixes = self._cypher_cache.get(cache_key)
+        if affixes is None:
+            index_name = self.underlying_index_name()
+            affixes = (f'index: {index_name}\n\n', f'\n\nindex: {index_name}\n')
+            self._cypher_cache[cache_key] = affixes
+        return affixes
+
+    def _top_k_result_cache_key(self) -> Tuple[str, str]:
+        return (self.neptune_client.graph_id, self.index_name)
+
+    def _embedding_cache(self) -> Optional[EmbeddingCache]:
+        cache_size = GraphRAGConfig.embedding_cache_size
+        if cache_size <= 0:
+            return None
+        cache = self._node_embedding_cache
+        if cache is None or cache.embed_model is not self.embed_model or cache.max_size != cache_size:
+            cache = EmbeddingCache(self.embed_model, cache_size)
+            self._node_embedding_cache = cache
+        return cache
 
     def _neptune_client(self):
         """
@@ -142,6 +278,8 @@ class NeptuneIndex(VectorIndex):
         If the tenant ID corresponds to the default tenant, the unwrapped Neptune
         client is returned. Otherwise, it wraps the Neptune client with a
         Multi-tenant Graph Store for the corresponding tenant ID and returns it.
+        Wrapped clients are cached per tenant, so repeated calls for the same tenant
+        reuse the same wrapper.
 
         Returns:
             NeptuneClient or MultiTenantGraphStore: An instance of the Neptune
@@ -151,7 +289,11 @@ class NeptuneIndex(VectorIndex):
         if self.tenant_id.is_default_tenant():
             return self.neptune_client
         else:
-            return MultiTenantGraphStore.wrap(self.neptune_client, tenant_id=self.tenant_id)
+            client = self._tenant_clients.get(self.tenant_id.value)
+            if client is None:
+                client = MultiTenantGraphStore.wrap(self.neptune_client, tenant_id=self.tenant_id)
+                self._tenant_clients[self.tenant_id.value] = client
+            return client
 
     
     def add_embeddings(self, nodes):
@@ -160,8 +302,10 @@ class NeptuneIndex(VectorIndex):
         and updates these embeddings in Neptune using the appropriate queries.
 
         This function takes a list of nodes, computes their embeddings using the associated
-        embedding model, and updates these embeddings in the Neptune database. It also ensures
-        that temporary metadata added to the nodes is removed after processing.
+        embedding model, and upserts these embeddings in the Neptune database using batched
+        queries of up to `upsert_batch_size` nodes. Each batch is embedded in the background
+        while the previous batch is upserted. The index name is added to copies of the
+        nodes used for embedding, so the caller's nodes are left unmodified.
 
         Args:
             nodes (list): A list of node objects. Each node should have a `metadata` dictionary
@@ -174,44 +318,55 @@ class NeptuneIndex(VectorIndex):
         if not self.writeable:
             raise IndexError(f'Index {self.index_name} is read-only')
         
-        text_map = { node.node_id: node.text for node in nodes }
-        
-        for node in nodes:
-            node.metadata['index'] = self.underlying_index_name()
-            node.text = f'''index: {self.underlying_index_name()}
-
-{node.text}
+        index_name = self.underlying_index_name()
+        (prefix, suffix) = self._index_text_affixes()
+        embedding_cache = self._embedding_cache()
+
+        def embed_batch(batch_nodes):
+            embedding_nodes = [
+                node.model_copy(update={
+                    'text': prefix + node.text + suffix,
+                    'metadata': {**node.metadata, 'index': index_name}
+                })
+                for node in batch_nodes
+            ]
+                        
+            id_to_embed_map = embed_nodes_with_cache(
+                embedding_nodes, self.embed_model, embedding_cache
+            )
 
-index: {self.underlying_index_name()}
-'''
-                    
-        id_to_embed_map = embed_nodes(
-            nodes, self.embed_model
-        )
+            return [
+                {
+                    'nodeId': node.node_id,
+                    'embedding': id_to_embed_map[node.node_id]
+                }
+                for node in batch_nodes
+            ]
         
-        for node in nodes:
-        
-            statement = f"MATCH (n:`{self.label}`) WHERE {self.neptune_client.node_id('n.{self.id_name}')} = $nodeId"
-            
-            embedding = id_to_embed_map[node.node_id]
-            
-            query = '\n'.join([
-                statement,
-                f'WITH n CALL neptune.algo.vectors.upsert(n, {embedding}) YIELD success RETURN success'
-            ])
-            
-            properties = {
-                'nodeId': node.node_id,
-                'embedding': embedding
-            }
-
-            self._neptune_client().execute_query_with_retry(query, properties)
-            
-            
-            
-        for node in nodes:
-            node.metadata.pop('index', None)
-            node.text = text_map[node.node_id]
+        cache_key = ('add_embeddings',)
+        query = self._cypher_cache.get(cache_key)
+
+        if query is None:
+            query = f'''UNWIND $params AS params
+        MATCH (n:`{self.label}`) WHERE {self.neptune_client.node_id(f'n.{self.id_name}')} = params.nodeId
+        WITH n, params CALL neptune.algo.vectors.upsert(n, params.embedding) YIELD success RETURN success'''
+            self._cypher_cache[cache_key] = query
+
+        neptune_client = self._neptune_client()
+        batches = list(iter_batch(nodes, self.upsert_batch_size))
+
+        if len(batches) == 1:
+            neptune_client.execute_query_with_retry(query, {'params': embed_batch(batches[0])})
+        elif batches:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                next_params = executor.submit(embed_batch, batches[0])
+                for i in range(len(batches)):
+                    params = next_params.result()
+                    if i + 1 < len(batches):
+                        next_params = executor.submit(embed_batch, batches[i + 1])
+                    neptune_client.execute_query_with_retry(query, {'params': params})
+
+        _invalidate_top_k_results(self._top_k_result_cache_key())
         
         return nodes
     
@@ -221,6 +376,14 @@ index: {self.underlying_index_name()}
         from an underlying Neptune Graph database index. The function internally performs
         embedding transformations, constructs queries, and applies filtering criteria.
 
+        If `GraphRAGConfig.vector_query_cache_size` is greater than zero, results are
+        held in a process-wide cache, keyed by graph, index, tenant, query string, top_k
+        and filter, for `GraphRAGConfig.vector_query_cache_ttl_seconds`. Adding
+        embeddings through any NeptuneIndex for the same graph and index in this process
+        invalidates that index's cached results. The cache is not coherent across
+        processes: writes made by other processes, such as build pipeline workers, are
+        only reflected once the cached results expire.
+
         Args:
             query_bundle (QueryBundle): The query bundle containing the query string and
                 potentially other context required for querying the index.
@@ -232,49 +395,105 @@ index: {self.underlying_index_name()}
             List[Dict]: A list of results where each result dictionary contains a 'score' field
                 and the fields specified in self.return_fields.
         """
-        query_str = f'''index: {self.underlying_index_name()}
+        where_clause, filter_params =  filter_config_to_parameterized_opencypher_filters(filter_config)
+        where_clause = f'WHERE {where_clause}' if where_clause else ''
 
-{query_bundle.query_str}
-'''
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'filter: {where_clause}, params: {filter_params}')
 
-        query_bundle = QueryBundle(query_str=query_str) 
-        query_bundle = to_embedded_query(query_bundle, self.embed_model)
+        result_cache = _shared_top_k_result_cache()
+        index_key = self._top_k_result_cache_key()
+        result_cache_key = (index_key, _top_k_result_cache_version(index_key), self.tenant_id.value, query_bundle.query_str, top_k, self.overfetch_factor, where_clause, tuple(filter_params.items()))
 
-        tenant_specific_label = self.tenant_id.format_label(self.label).replace('`', '')
+        if result_cache is not None:
+            cached_results = result_cache.get(result_cache_key)
+            if cached_results is not None:
+                return cached_results
 
-        where_clause =  filter_config_to_opencypher_filters(filter_config)
-        where_clause = f'WHERE {where_clause}' if where_clause else ''
+        (prefix, _) = self._index_text_affixes()
 
-        logger.debug(f'filter: {where_clause}')
+        query_embedding = to_embedded_query(QueryBundle(query_str=f'{prefix}{query_bundle.query_str}\n'), self.embed_model).embedding
 
-        cypher = f'''
+        cache_key = ('top_k', top_k, self.overfetch_factor, where_clause)
+        cypher = self._cypher_cache.get(cache_key)
+
+        if cypher is None:
+            # without a filter on the path, only the top_k candidates need to be traversed
+            candidate_limit = '' if where_clause else f'WITH {self.index_name}, score ORDER BY score ASC LIMIT {top_k}'
+            cypher = f'''
         CALL neptune.algo.vectors.topKByEmbedding(
-            {query_bundle.embedding},
+            $queryEmbedding,
             {{   
-                topK: {top_k * 5},
+                topK: {top_k * self.overfetch_factor},
                 concurrency: 4
             }}
         )
         YIELD node, score       
-        WITH node as {self.index_name}, score WHERE '{tenant_specific_label}' in labels({self.index_name}) 
-        WITH {self.index_name}, score ORDER BY score ASC LIMIT {top_k}
+        WITH node as {self.index_name}, score WHERE $tenantLabel in labels({self.index_name}) 
+        {candidate_limit}
         MATCH {self.path}
         {where_clause}
+        WITH {self.index_name}, source, score ORDER BY score ASC LIMIT {top_k}
         RETURN {{
             score: score,
             {self.return_fields}
-        }} AS result ORDER BY result.score ASC LIMIT {top_k}
+        }} AS result
         '''
+            self._cypher_cache[cache_key] = cypher
 
-        results = self._neptune_client().execute_query(cypher)
+        params = {
+            **filter_params,
+            'queryEmbedding': query_embedding,
+            'tenantLabel': self._tenant_label()
+        }
+
+        results = list(map(itemgetter('result'), self._neptune_client().execute_query(cypher, params)))
+        results.sort(key=itemgetter('score'))
+
+        if result_cache is not None:
+            result_cache.put(result_cache_key, results)
         
-        return [result['result'] for result in results]
+        return results
+
+    def top_k_batch(self, query_bundles:List[QueryBundle], top_k:int=5, filter_config:Optional[FilterConfig]=None):
+        """
+        Fetches the top-k records for each of several queries. Each distinct query
+        string is searched once with `top_k`, and the distinct queries are run
+        concurrently as described in `VectorIndex.top_k_batch`.
+
+        Args:
+            query_bundles (List[QueryBundle]): The query bundles for which records are
+                to be fetched.
+            top_k (int, optional): The number of top records to fetch per query. Defaults to 5.
+            filter_config (Optional[FilterConfig]): Configuration for applying filters to
+                the queries to refine results, if provided.
+
+        Returns:
+            List[List[Dict]]: The results for each query, in the same order as
+                `query_bundles`. Each result dictionary contains a 'score' field and
+                the fields specified in self.return_fields.
+        """
+        distinct_query_bundles = list({
+            query_bundle.query_str: query_bundle 
+            for query_bundle in query_bundles
+        }.values())
+
+        results = super().top_k_batch(distinct_query_bundles, top_k=top_k, filter_config=filter_config)
+
+        results_by_query_str = {
+            query_bundle.query_str: query_results
+            for query_bundle, query_results in zip(distinct_query_bundles, results)
+        }
+
+        return [list(results_by_query_str[query_bundle.query_str]) for query_bundle in query_bundles]
 
     def get_embeddings(self, ids:List[str]=[]):
         """
-        Fetches embeddings for the specified node IDs by executing a Cypher query on the
-        database. The function retrieves node embeddings and other specified result fields
-        based on tenant-specific configurations and returns the collected results.
+        Fetches embeddings for the specified node IDs by executing batched Cypher queries,
+        each covering up to `GET_EMBEDDINGS_BATCH_SIZE` IDs, on the database. When there is
+        more than one batch, up to `GET_EMBEDDINGS_MAX_WORKERS` batches are queried
+        concurrently. The function retrieves node embeddings and other specified result
+        fields based on tenant-specific configurations and returns the collected results.
 
         Args:
             ids (List[str]): A list of unique node IDs for which embeddings are to be fetched.
@@ -284,33 +503,45 @@ index: {self.underlying_index_name()}
             List[Dict]: A list of dictionaries, where each dictionary contains the retrieved
             embedding and other specified fields for a node.
         """
-        all_results = []
+        if not ids:
+            return []
 
-        tenant_specific_label = self.tenant_id.format_label(self.label).replace('`', '')
-        
-        for i in set(ids):
+        cache_key = ('get_embeddings',)
+        cypher = self._cypher_cache.get(cache_key)
 
+        if cypher is None:
             cypher = f'''
-            MATCH (n:`{self.label}`)  WHERE {self.neptune_client.node_id('n.{self.id_name}')} = $elementId
+            UNWIND $elementIds AS elementId
+            MATCH (n:`{self.label}`)  WHERE {self.neptune_client.node_id(f'n.{self.id_name}')} = elementId
             CALL neptune.algo.vectors.get(
                 n
             )
             YIELD node, embedding       
-            WITH node as {self.index_name}, embedding WHERE '{tenant_specific_label}' in labels({self.index_name}) 
+            WITH node as {self.index_name}, embedding WHERE $tenantLabel in labels({self.index_name}) 
             MATCH {self.path}
             RETURN {{
                 embedding: embedding,
                 {self.return_fields}
             }} AS result
             '''
+            self._cypher_cache[cache_key] = cypher
             
+        tenant_label = self._tenant_label()
+        neptune_client = self._neptune_client()
+
+        def get_batch(element_ids:List[str]):
             params = {
-                'elementId': i
+                'elementIds': element_ids,
+                'tenantLabel': tenant_label
             }
-            
-            results = self._neptune_client().execute_query(cypher, params)
-            
-            for result in results:
-                all_results.append(result['result'])
-        
-        return all_results
+            return list(map(itemgetter('result'), neptune_client.execute_query(cypher, params)))
+
+        batches = list(iter_batch(list(dict.fromkeys(ids)), GET_EMBEDDINGS_BATCH_SIZE))
+
+        if len(batches) == 1:
+            return get_batch(batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), GET_EMBEDDINGS_MAX_WORKERS)) as executor:
+            batch_results = list(executor.map(get_batch, batches))
+
+        return [result for results in batch_results for result in results]
@@ -25,6 +25,8 @@ class OpenSearchVectorIndexFactory(VectorIndexFactoryMethod):
         relies on the methods and details passed during the instantiation and
         method calls.
     """
+    prefixes = (OPENSEARCH_SERVERLESS,)
+
     def try_create(self, index_names:List[str], vector_index_info:str, **kwargs) -> List[VectorIndex]:
         """
         Attempts to create a list of vector indexes using the provided index names and vector
@@ -3,21 +3,24 @@
 
 
 import json
+import atexit
 import logging
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Any, Optional, Iterable, Dict
 from dataclasses import dataclass
 
 from llama_index.core.bridge.pydantic import PrivateAttr
 from llama_index.core.schema import BaseNode, NodeWithScore, QueryBundle
 from llama_index.core.vector_stores.types import  VectorStoreQueryResult, VectorStoreQueryMode, MetadataFilters, MetadataFilter
-from llama_index.core.indices.utils import embed_nodes
 from llama_index.core.vector_stores.types import MetadataFilters
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig, is_datetime_key, format_datetime
 from graphrag_toolkit.lexical_graph.config import GraphRAGConfig, EmbeddingType
 from graphrag_toolkit.lexical_graph.storage.vector import VectorIndex, to_embedded_query
+from graphrag_toolkit.lexical_graph.storage.vector.embedding_cache import EmbeddingCache, embed_nodes_with_cache
 from graphrag_toolkit.lexical_graph.storage.constants import INDEX_KEY
 
 logger = logging.getLogger(__name__)
@@ -212,6 +215,37 @@ def index_is_available(client, index_name):
     
 
 
+INDEX_ADMIN_CLIENT_TTL_SECONDS = 300
+
+_index_admin_clients:Dict[str, tuple] = {}
+_index_admin_clients_lock = threading.Lock()
+
+def _index_admin_client(endpoint):
+    # One client is shared per endpoint. It is replaced, and the old client closed,
+    # when the configured AWS session or region changes, or when it is older than
+    # INDEX_ADMIN_CLIENT_TTL_SECONDS, so that credentials are re-read periodically
+    session = GraphRAGConfig.session
+    region = GraphRAGConfig.aws_region
+    now = time.monotonic()
+    with _index_admin_clients_lock:
+        entry = _index_admin_clients.get(endpoint)
+        if entry is not None:
+            (client_session, client_region, expires_at, client) = entry
+            if client_session is session and client_region == region and now < expires_at:
+                return client
+            client.close()
+        client = create_os_client(endpoint)
+        _index_admin_clients[endpoint] = (session, region, now + INDEX_ADMIN_CLIENT_TTL_SECONDS, client)
+        return client
+
+def _close_index_admin_clients():
+    with _index_admin_clients_lock:
+        for (_, _, _, client) in _index_admin_clients.values():
+            client.close()
+        _index_admin_clients.clear()
+
+atexit.register(_close_index_admin_clients)
+
 def index_exists(endpoint, index_name, dimensions, writeable) -> bool:
     """
     Checks if an OpenSearch index exists, and optionally creates it if it does not exist.
@@ -221,6 +255,11 @@ def index_exists(endpoint, index_name, dimensions, writeable) -> bool:
     the `writeable` flag is True, it will create an index using the provided
     dimensions and a predefined method for handling knn_vector elements.
 
+    The OpenSearch client used for these checks is shared by all index administration
+    calls for the same endpoint, rather than created and closed on every call. It is
+    replaced when the configured AWS session or region changes, or after
+    `INDEX_ADMIN_CLIENT_TTL_SECONDS`.
+
     Args:
         endpoint: The OpenSearch endpoint to connect to.
         index_name: The name of the index to check for existence.
@@ -230,7 +269,7 @@ def index_exists(endpoint, index_name, dimensions, writeable) -> bool:
     Returns:
         bool: True if the index exists (or is created successfully), False otherwise.
     """
-    client = create_os_client(endpoint, pool_maxsize=1)
+    client = _index_admin_client(endpoint)
 
     embedding_field = 'embedding'
     method = {
@@ -266,8 +305,6 @@ def index_exists(endpoint, index_name, dimensions, writeable) -> bool:
             logger.debug(f'OpenSearch index already exists [index_name: {index_name}, endpoint: {endpoint}]')
         else:
             logger.exception('Error creating an OpenSearch index')
-    finally:
-        client.close()
 
     return index_exists
         
@@ -319,7 +356,7 @@ def create_opensearch_vector_client(endpoint, index_name, dimensions, embed_mode
 
             while not is_available and elapsed < 60:
                 elapsed = int(time.time() - start) 
-                is_available = index_is_available(client._os_client, index_name)
+                is_available = index_is_available(_index_admin_client(endpoint), index_name)
                 if not is_available:
                     logger.debug(f'Index not yet online, waiting 10 seconds [index_name: {index_name}, endpoint: {endpoint}, elapsed_seconds: {elapsed}]')
                     time.sleep(10)
@@ -476,14 +513,16 @@ class OpenSearchIndex(VectorIndex):
     embed_model:EmbeddingType
 
     _client: OpensearchVectorClient = PrivateAttr(default=None)
+    _node_embedding_cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
 
     def __getstate__(self):
         """
-        Serializes the current state of the object while excluding the client attribute.
+        Serializes the current state of the object while excluding the client attribute
+        and the embedding cache.
 
-        This method overrides the default __getstate__ method to ensure the _client
-        attribute is set to None during the serialization process. It returns the
-        state from the superclass's implementation of __getstate__.
+        This method overrides the default __getstate__ method to ensure the _client and
+        _node_embedding_cache attributes are set to None during the serialization process.
+        It returns the state from the superclass's implementation of __getstate__.
 
         Returns:
             dict: The serialized state of the object.
@@ -491,6 +530,7 @@ class OpenSearchIndex(VectorIndex):
         if self._client and self._client._os_client:
             self._client._os_client.close()
         self._client = None
+        self._node_embedding_cache = None
         return super().__getstate__()
         
     @property
@@ -530,6 +570,16 @@ class OpenSearchIndex(VectorIndex):
     def index_exists(self):
         return index_exists(self.endpoint, self.underlying_index_name(), self.dimensions, self.writeable)
         
+    def _embedding_cache(self) -> Optional[EmbeddingCache]:
+        cache_size = GraphRAGConfig.embedding_cache_size
+        if cache_size <= 0:
+            return None
+        cache = self._node_embedding_cache
+        if cache is None or cache.embed_model is not self.embed_model or cache.max_size != cache_size:
+            cache = EmbeddingCache(self.embed_model, cache_size)
+            self._node_embedding_cache = cache
+        return cache
+
     def _clean_id(self, s):
         """
         Cleans and normalizes a given string by removing all non-alphanumeric characters.
@@ -643,18 +693,14 @@ class OpenSearchIndex(VectorIndex):
             if node.node_id in non_existent_node_ids
         ]
         
-        id_to_embed_map = embed_nodes(
-            nodes, self.embed_model
+        id_to_embed_map = embed_nodes_with_cache(
+            nodes, self.embed_model, self._embedding_cache()
         )
 
-        docs = []
-
-        for node in nodes:
-
-            doc:BaseNode = node.copy()
-            doc.embedding = id_to_embed_map[node.node_id]
-
-            docs.append(doc)
+        docs = [
+            node.model_copy(update={'embedding': id_to_embed_map[node.node_id]})
+            for node in nodes
+        ]
 
         if docs:
             errors = self.client.index_results(docs)
@@ -779,7 +825,8 @@ class OpenSearchIndex(VectorIndex):
         the results page by page. Designed to handle large datasets by leveraging
         the `search_after` parameter of Elasticsearch, allowing seamless scrolling
         through data without encountering size limitations. By setting a maximum
-        number of pages, users can limit the extent of data retrieval.
+        number of pages, users can limit the extent of data retrieval. The next page
+        is fetched in the background while the caller processes the current page.
 
         Args:
             query: The Elasticsearch query used to filter the documents to be retrieved.
@@ -795,10 +842,7 @@ class OpenSearchIndex(VectorIndex):
         if client is None:
             return
 
-        search_after = None
-        page = 0
-        
-        while True:
+        def search_page(search_after):
             body = {
                 "size": page_size,
                 "query": query,
@@ -829,21 +873,32 @@ class OpenSearchIndex(VectorIndex):
                         logger.debug(f'Index not found while conducting paginated search - retrying after 5 seconds [index: {self.underlying_index_name()}, retry_count: {retry_count}]')
                         time.sleep(5)
                         response = None
-                except Exception as ee:
+                except Exception as e:
                     logger.error(f'Error while conducting search with client: {client}')
                     raise e
 
-            hits = response['hits']['hits']
-            if not hits:
-                break
+            return response['hits']['hits']
 
-            yield hits
+        page = 0
 
-            search_after = hits[-1]['sort']
-            page += 1
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_hits = executor.submit(search_page, None)
 
-            if max_pages and page >= max_pages:
-                break
+            while True:
+                hits = next_hits.result()
+                if not hits:
+                    break
+
+                page += 1
+                last_page = max_pages and page >= max_pages
+
+                if not last_page:
+                    next_hits = executor.submit(search_page, hits[-1]['sort'])
+
+                yield hits
+
+                if last_page:
+                    break
 
     def get_all_embeddings(self, query:str, max_results=None, ids_only=False):
         """
@@ -12,6 +12,8 @@ POSTGRES = 'postgres://'
 POSTGRESQL = 'postgresql://'
 
 class PGVectorIndexFactory(VectorIndexFactoryMethod):
+    prefixes = (POSTGRES, POSTGRESQL)
+
     def try_create(self, index_names:List[str], vector_index_info:str, **kwargs) -> List[VectorIndex]:
         """
         Tries to create and return a list of vector indexes using the given parameters.
@@ -31,6 +31,42 @@ except ImportError as e:
     ) from e
     
 
+def _default_value_formatter(x):
+    return x
+
+def _format_text_match(x):
+    return f"%%{x}%%"
+
+SQL_OPERATORS = {
+    FilterOperator.EQ: ('=', _default_value_formatter), 
+    FilterOperator.GT: ('>', _default_value_formatter), 
+    FilterOperator.LT: ('<', _default_value_formatter), 
+    FilterOperator.NE: ('<>', _default_value_formatter), 
+    FilterOperator.GTE: ('>=', _default_value_formatter), 
+    FilterOperator.LTE: ('<=', _default_value_formatter), 
+    #FilterOperator.IN: ('in', _default_value_formatter),  # In array (string or number)
+    #FilterOperator.NIN: ('nin', _default_value_formatter),  # Not in array (string or number)
+    #FilterOperator.ANY: ('any', _default_value_formatter),  # Contains any (array of strings)
+    #FilterOperator.ALL: ('all', _default_value_formatter),  # Contains all (array of strings)
+    FilterOperator.TEXT_MATCH: ('LIKE', _format_text_match),
+    FilterOperator.TEXT_MATCH_INSENSITIVE: ('~*', _default_value_formatter),
+    #FilterOperator.CONTAINS: ('contains', _default_value_formatter),  # metadata array contains value (string or number)
+    FilterOperator.IS_EMPTY: ('IS NULL', _default_value_formatter),  # the field is not exist or empty (null or empty array)
+}
+
+def _format_sql_text(x):
+    return f"'{x}'"
+
+def _format_sql_timestamp(x):
+    return f"'{format_datetime(x)}'"
+
+SQL_TYPE_FORMATTERS = {
+    'text': _format_sql_text,
+    'timestamp': _format_sql_timestamp,
+    'int': _default_value_formatter,
+    'float': _default_value_formatter
+}
+
 def to_sql_operator(operator: FilterOperator) -> tuple[str, Callable[[Any], str]]:
     """
     Converts a filter operator into an SQL operator and its respective value formatter.
@@ -51,29 +87,10 @@ def to_sql_operator(operator: FilterOperator) -> tuple[str, Callable[[Any], str]
     Raises:
         ValueError: If the provided `operator` is not supported.
     """
-    default_value_formatter = lambda x: x
-    
-    operator_map = {
-        FilterOperator.EQ: ('=', default_value_formatter), 
-        FilterOperator.GT: ('>', default_value_formatter), 
-        FilterOperator.LT: ('<', default_value_formatter), 
-        FilterOperator.NE: ('<>', default_value_formatter), 
-        FilterOperator.GTE: ('>=', default_value_formatter), 
-        FilterOperator.LTE: ('<=', default_value_formatter), 
-        #FilterOperator.IN: ('in', default_value_formatter),  # In array (string or number)
-        #FilterOperator.NIN: ('nin', default_value_formatter),  # Not in array (string or number)
-        #FilterOperator.ANY: ('any', default_value_formatter),  # Contains any (array of strings)
-        #FilterOperator.ALL: ('all', default_value_formatter),  # Contains all (array of strings)
-        FilterOperator.TEXT_MATCH: ('LIKE', lambda x: f"%%{x}%%"),
-        FilterOperator.TEXT_MATCH_INSENSITIVE: ('~*', default_value_formatter),
-        #FilterOperator.CONTAINS: ('contains', default_value_formatter),  # metadata array contains value (string or number)
-        FilterOperator.IS_EMPTY: ('IS NULL', default_value_formatter),  # the field is not exist or empty (null or empty array)
-    }
-
-    if operator not in operator_map:
+    sql_operator = SQL_OPERATORS.get(operator)
+    if sql_operator is None:
         raise ValueError(f'Unsupported filter operator: {operator}')
-    
-    return operator_map[operator]
+    return sql_operator
 
 def formatter_for_type(type_name:str) -> Callable[[Any], str]:
     """
@@ -93,15 +110,24 @@ def formatter_for_type(type_name:str) -> Callable[[Any], str]:
     Raises:
         ValueError: If the specified type name is not supported.
     """
-    if type_name == 'text':
-        return lambda x: f"'{x}'"
-    elif type_name == 'timestamp':
-        return lambda x: f"'{format_datetime(x)}'"
-    elif type_name in ['int', 'float']:
-        return lambda x:x
-    else:
+    formatter = SQL_TYPE_FORMATTERS.get(type_name)
+    if formatter is None:
         raise ValueError(f'Unsupported type name: {type_name}')
+    return formatter
 
+def _to_sql_key(key: str) -> str:
+    return f"metadata->'source'->'metadata'->>'{key}'"
+
+def _metadata_filter_to_sql_filter(f: MetadataFilter) -> str:
+    key = _to_sql_key(f.key)
+    (operator, operator_formatter) = to_sql_operator(f.operator)
+
+    if f.operator == FilterOperator.IS_EMPTY:
+        return f"({key} {operator})"
+    else:
+        type_name = type_name_for_key_value(f.key, f.value)
+        type_formatter = formatter_for_type(type_name)
+        return f"(({key})::{type_name} {operator} {type_formatter(operator_formatter(str(f.value)))})"
 
 def parse_metadata_filters_recursive(metadata_filters:MetadataFilters) -> str:
     """
@@ -125,62 +151,13 @@ def parse_metadata_filters_recursive(metadata_filters:MetadataFilters) -> str:
             `metadata_filters` structure, or if an unsupported filter condition
             is provided.
     """
-    def to_key(key: str) -> str:
-        """
-        Parses metadata filters recursively into a string representation suitable for
-        a database query.
-
-        The function takes metadata filters and processes them recursively to generate
-        a string representation that can be incorporated into database queries. It
-        utilizes helper functions for converting filter keys into the specific format
-        used in the query syntax.
-
-        Args:
-            metadata_filters: MetadataFilters instance representing the metadata filters
-                to be processed.
-
-        Returns:
-            str: A string representation of the metadata filters formatted for database
-                queries.
-        """
-        return f"metadata->'source'->'metadata'->>'{key}'"
-    
-    def to_sql_filter(f: MetadataFilter) -> str:
-        """
-        Parses metadata filters recursively to generate an SQL-compatible filter string.
-
-        This function processes a collection of metadata filters, converting them step
-        by step into a valid SQL-like filter expression. It makes use of helper
-        functions to generate the appropriate SQL syntax for filters and their
-        operators while handling specific cases like empty filters.
-
-        Args:
-            metadata_filters (MetadataFilters): A structured object containing metadata
-                filters that need to be processed into SQL-compatible expressions.
-
-        Returns:
-            str: A string representing the SQL-compatible filter derived from the
-            provided metadata filters.
-        """
-        key = to_key(f.key)
-        (operator, operator_formatter) = to_sql_operator(f.operator)
-
-        if f.operator == FilterOperator.IS_EMPTY:
-            return f"({key} {operator})"
-        else:
-            type_name = type_name_for_key_value(f.key, f.value)
-            type_formatter = formatter_for_type(type_name)
-            return f"(({key})::{type_name} {operator} {type_formatter(operator_formatter(str(f.value)))})"
-    
-    condition = metadata_filters.condition.value
-
     filter_strs = []
 
     for metadata_filter in metadata_filters.filters:
         if isinstance(metadata_filter, MetadataFilter):
             if metadata_filters.condition == FilterCondition.NOT:
                 raise ValueError(f'Expected MetadataFilters for FilterCondition.NOT, but found MetadataFilter')
-            filter_strs.append(to_sql_filter(metadata_filter))
+            filter_strs.append(_metadata_filter_to_sql_filter(metadata_filter))
         elif isinstance(metadata_filter, MetadataFilters):
             filter_strs.append(parse_metadata_filters_recursive(metadata_filter))
         else:
@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+def _copy_value(value:Any) -> Any:
+    # query results are JSON-shaped, so copying dicts and lists directly is much
+    # cheaper than copy.deepcopy, which is kept for any other mutable values
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    value_type = type(value)
+    if value_type is dict:
+        return {k: _copy_value(v) for k, v in value.items()}
+    if value_type is list:
+        return [_copy_value(v) for v in value]
+    return copy.deepcopy(value)
+
+class QueryResultCache:
+    """
+    A thread-safe, size-bounded LRU cache of query results with a time-to-live.
+
+    Entries are evicted when the cache exceeds `max_size` (least recently used
+    first) or when they are older than `ttl_seconds`. Values are deep-copied on
+    the way in and out, so callers are free to modify the results they receive.
+    Dicts and lists are copied directly rather than with `copy.deepcopy`, which is
+    only used for other mutable values.
+
+    Attributes:
+        max_size (int): The maximum number of entries held by the cache.
+        ttl_seconds (float): The number of seconds an entry remains valid.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups not found in the cache, or expired.
+        evictions (int): The number of entries evicted to keep the cache within `max_size`.
+    """
+    def __init__(self, max_size:int, ttl_seconds:float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries:OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key:Hashable) -> Optional[Any]:
+        """
+        Returns a copy of the value cached for the given key, or None if the key is
+        not cached or its entry has expired.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[Any]: A copy of the cached value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy_value(value)
+
+    def put(self, key:Hashable, value:Any):
+        """
+        Caches a copy of the value under the given key, evicting the least recently
+        used entries if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+        """
+        value = _copy_value(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
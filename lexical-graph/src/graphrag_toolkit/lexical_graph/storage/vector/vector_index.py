@@ -4,6 +4,7 @@
 import logging
 import abc
 import queue
+from concurrent.futures import ThreadPoolExecutor
 
 from typing import Sequence, Any, List, Dict, Optional
 from llama_index.core.schema import QueryBundle, BaseNode
@@ -17,6 +18,8 @@ from graphrag_toolkit.lexical_graph.storage.constants import ALL_EMBEDDING_INDEX
 
 logger = logging.getLogger(__name__)
 
+TOP_K_BATCH_MAX_WORKERS = 10
+
 def to_embedded_query(query_bundle:QueryBundle, embed_model:EmbeddingType) -> QueryBundle:
     """
     Converts a query bundle into an embedded query if not already embedded.
@@ -150,6 +153,33 @@ class VectorIndex(BaseModel):
         """
         raise NotImplementedError
 
+    def top_k_batch(self, query_bundles:Sequence[QueryBundle], top_k:int=5, filter_config:Optional[FilterConfig]=None) -> List[Sequence[Dict[str, Any]]]:
+        """
+        Retrieves the top-k relevant items for each of several queries. The default
+        implementation calls `top_k` once per query, running up to
+        `TOP_K_BATCH_MAX_WORKERS` queries concurrently; implementing classes that can
+        answer several queries in a single request should override this method.
+
+        Args:
+            query_bundles: The queries for which relevant items are to be fetched.
+            top_k: The maximum number of top relevant items to return per query.
+            filter_config: An optional filter configuration applied to every query.
+
+        Returns:
+            List[Sequence[Dict[str, Any]]]: The top-k results for each query, in the
+            same order as `query_bundles`.
+        """
+        if len(query_bundles) < 2:
+            return [
+                self.top_k(query_bundle, top_k=top_k, filter_config=filter_config) 
+                for query_bundle in query_bundles
+            ]
+        with ThreadPoolExecutor(max_workers=min(len(query_bundles), TOP_K_BATCH_MAX_WORKERS)) as executor:
+            return list(executor.map(
+                lambda query_bundle: self.top_k(query_bundle, top_k=top_k, filter_config=filter_config), 
+                query_bundles
+            ))
+
 
     @abc.abstractmethod
     def get_embeddings(self, ids:List[str]=[]) -> Sequence[Dict[str, Any]]:
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import abc
-from typing import List
+from typing import List, Tuple
 
 from graphrag_toolkit.lexical_graph.storage.vector.vector_index import VectorIndex
 
@@ -19,8 +19,12 @@ class VectorIndexFactoryMethod():
     on provided input.
 
     Attributes:
-        None
+        prefixes (Tuple[str, ...]): Connection string prefixes (e.g. `'neptune-graph://'`)
+            handled by this factory. `VectorStoreFactory` uses these to dispatch directly
+            to the factory; factories with no prefixes are tried in registration order.
     """
+    prefixes:Tuple[str, ...] = ()
+
     @abc.abstractmethod
     def try_create(self, index_names:List[str], vector_index_info:str, **kwargs) -> List[VectorIndex]:
         raise NotImplementedError
\ No newline at end of file
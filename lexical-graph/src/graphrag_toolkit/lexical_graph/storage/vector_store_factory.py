@@ -1,7 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Union, Type, Dict
+from typing import List, Union, Type, Dict, Optional
 from graphrag_toolkit.lexical_graph.storage.vector import VectorStore, VectorIndexFactoryMethod
 from graphrag_toolkit.lexical_graph.storage.vector.opensearch_vector_index_factory import OpenSearchVectorIndexFactory
 from graphrag_toolkit.lexical_graph.storage.vector.neptune_vector_indexes import NeptuneAnalyticsVectorIndexFactory
@@ -14,6 +14,15 @@ VectorStoreType = Union[str, VectorStore]
 VectorIndexFactoryMethodType = Union[VectorIndexFactoryMethod, Type[VectorIndexFactoryMethod]]
 
 _vector_index_factories:Dict[str, VectorIndexFactoryMethod] = { c.__name__ : c() for c in [OpenSearchVectorIndexFactory, PGVectorIndexFactory, NeptuneAnalyticsVectorIndexFactory, DummyVectorIndexFactory] }
+_vector_index_factories_by_prefix:Dict[str, VectorIndexFactoryMethod] = { prefix : factory for factory in _vector_index_factories.values() for prefix in factory.prefixes }
+
+def _factory_for_prefix(vector_store_info:str) -> Optional[VectorIndexFactoryMethod]:
+    if not isinstance(vector_store_info, str):
+        return None
+    scheme_end = vector_store_info.find('://')
+    if scheme_end < 0:
+        return None
+    return _vector_index_factories_by_prefix.get(vector_store_info[:scheme_end + 3])
 
 class VectorStoreFactory():
     """Manages the registration and creation of vector index factories and vector stores.
@@ -31,7 +40,8 @@ class VectorStoreFactory():
         """
         Registers a factory method for vector index creation. This method allows
         the addition of custom factory methods to the global registry, enabling
-        dynamic instantiation of vector index objects based on the factory type.
+        dynamic instantiation of vector index objects based on the factory type. The
+        factory is also indexed by each of its `prefixes` for direct dispatch.
 
         Args:
             factory_type: A factory method class or instance to register.
@@ -46,12 +56,16 @@ class VectorStoreFactory():
         if isinstance(factory_type, type):
             if not issubclass(factory_type, VectorIndexFactoryMethod):
                 raise ValueError(f'Invalid factory_type argument: {factory_type.__name__} must inherit from VectorIndexFactoryMethod.')
-            _vector_index_factories[factory_type.__name__] = factory_type()
+            factory = factory_type()
+            _vector_index_factories[factory_type.__name__] = factory
         else:
             factory_type_name = type(factory_type).__name__
             if not isinstance(factory_type, VectorIndexFactoryMethod):
                 raise ValueError(f'Invalid factory_type argument: {factory_type_name} must inherit from VectorIndexFactoryMethod.')
-            _vector_index_factories[factory_type_name] = factory_type
+            factory = factory_type
+            _vector_index_factories[factory_type_name] = factory
+        for prefix in factory.prefixes:
+            _vector_index_factories_by_prefix[prefix] = factory
 
     @staticmethod
     def for_vector_store(vector_store_info:str=None, index_names=DEFAULT_EMBEDDING_INDEXES, **kwargs):
@@ -59,6 +73,8 @@ class VectorStoreFactory():
         Creates a vector store instance or retrieves an existing one based on the provided
         vector store information and index names. This method utilizes specified factories to
         attempt creating vector indexes, and finally constructs a `VectorStore` object if successful.
+        The factory registered for the connection string's prefix is tried first; if it does not
+        create the indexes, the remaining factories are tried in registration order.
 
         Args:
             vector_store_info (str | VectorStore, optional): The vector store connection information or an
@@ -82,7 +98,15 @@ class VectorStoreFactory():
             return vector_store_info
         index_names = index_names if isinstance(index_names, list) else [index_names]
 
+        prefix_factory = _factory_for_prefix(vector_store_info)
+        if prefix_factory:
+            vector_indexes = prefix_factory.try_create(index_names, vector_store_info, **kwargs)
+            if vector_indexes:
+                return VectorStore(indexes={i.index_name: i for i in vector_indexes})
+
         for factory in _vector_index_factories.values():
+            if factory is prefix_factory:
+                continue
             vector_indexes = factory.try_create(index_names, vector_store_info, **kwargs)
             if vector_indexes:
                 return VectorStore(indexes={i.index_name: i for i in vector_indexes})
@@ -0,0 +1,46 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from llama_index.core.schema import QueryBundle
+
+from graphrag_toolkit.lexical_graph import GraphRAGConfig
+from graphrag_toolkit.lexical_graph.retrieval.retrievers.entity_network_search import EntityNetworkSearch
+from graphrag_toolkit.lexical_graph.storage.graph.dummy_graph_store import DummyGraphStore
+from graphrag_toolkit.lexical_graph.storage.vector import VectorStore
+from graphrag_toolkit.lexical_graph.storage.vector.dummy_vector_index import DummyVectorIndex
+
+
+calls = []
+
+
+class RecordingVectorIndex(DummyVectorIndex):
+
+    def top_k(self, query_bundle, top_k=5, filter_config=None):
+        calls.append(('top_k', query_bundle.query_str))
+        return [{'chunk': {'chunkId': 'c1'}}]
+
+    def top_k_batch(self, query_bundles, top_k=5, filter_config=None):
+        calls.append(('top_k_batch', [query_bundle.query_str for query_bundle in query_bundles]))
+        return [[{'chunk': {'chunkId': 'c1'}}] for _ in query_bundles]
+
+
+@pytest.fixture
+def retriever(monkeypatch):
+    calls.clear()
+    monkeypatch.setattr(GraphRAGConfig, '_vector_query_batching_enabled', None)
+    monkeypatch.delenv('VECTOR_QUERY_BATCHING_ENABLED', raising=False)
+    vector_store = VectorStore(indexes={'chunk': RecordingVectorIndex(index_name='chunk')})
+    return EntityNetworkSearch(DummyGraphStore(), vector_store)
+
+
+def test_start_node_ids_use_top_k_by_default(retriever):
+    assert retriever.get_start_node_ids(QueryBundle(query_str='query')) == ['c1']
+    assert calls == [('top_k', 'query')]
+
+
+def test_start_node_ids_use_top_k_batch_when_enabled(retriever):
+    GraphRAGConfig.vector_query_batching_enabled = True
+
+    assert retriever.get_start_node_ids(QueryBundle(query_str='query')) == ['c1']
+    assert calls == [('top_k_batch', ['query'])]
@@ -0,0 +1,131 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from datetime import date
+
+import pytest
+from llama_index.core.vector_stores.types import MetadataFilters, MetadataFilter, FilterOperator, FilterCondition
+
+from graphrag_toolkit.lexical_graph.metadata import FilterConfig
+from graphrag_toolkit.lexical_graph.storage.graph import graph_utils
+from graphrag_toolkit.lexical_graph.storage.graph.graph_utils import (
+    filter_config_to_opencypher_filters, 
+    filter_config_to_parameterized_opencypher_filters
+)
+
+
+class FakeDate(date):
+    current = date(2024, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+@pytest.fixture
+def fake_today(monkeypatch):
+    monkeypatch.setattr(graph_utils, 'date', FakeDate)
+    monkeypatch.setattr(FakeDate, 'current', date(2024, 1, 1))
+    return FakeDate
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse = graph_utils.parse_metadata_filters_recursive
+
+    def counting_parse(metadata_filters):
+        calls.append(metadata_filters)
+        return parse(metadata_filters)
+
+    monkeypatch.setattr(graph_utils, 'parse_metadata_filters_recursive', counting_parse)
+    return calls
+
+
+def test_cached_filters_are_not_reused_on_a_later_day(fake_today, parse_calls):
+    filter_config = FilterConfig(MetadataFilters(filters=[MetadataFilter(key='updated_date', value='10:30')]))
+
+    filter_config_to_opencypher_filters(filter_config)
+    filter_config_to_opencypher_filters(filter_config)
+
+    assert len(parse_calls) == 1
+
+    fake_today.current = date(2024, 1, 2)
+    filter_config_to_opencypher_filters(filter_config)
+
+    assert len(parse_calls) == 2
+
+
+def test_cached_parameterized_filters_are_not_reused_on_a_later_day(fake_today, monkeypatch):
+    filter_config = FilterConfig(MetadataFilters(filters=[MetadataFilter(key='updated_date', value='10:30')]))
+    values = iter(['2024-01-01T10:30:00', '2024-01-02T10:30:00'])
+    monkeypatch.setattr(graph_utils, 'format_datetime', lambda value: next(values))
+
+    (_, first_params) = filter_config_to_parameterized_opencypher_filters(filter_config, param_prefix='day')
+    fake_today.current = date(2024, 1, 2)
+    (_, second_params) = filter_config_to_parameterized_opencypher_filters(filter_config, param_prefix='day')
+
+    assert first_params != second_params
+
+
+def inline_params(opencypher_filters, params):
+    def format_value(value):
+        return f"'{value}'" if isinstance(value, str) else str(value)
+    return re.sub(r'\$(\w+)', lambda m: format_value(params[m.group(1)]), opencypher_filters)
+
+
+def nested_filters():
+    return MetadataFilters(
+        filters=[
+            MetadataFilter(key='url', value='https://example.com/a'),
+            MetadataFilters(
+                filters=[
+                    MetadataFilter(key='page', value=3, operator=FilterOperator.GT),
+                    MetadataFilter(key='author', operator=FilterOperator.IS_EMPTY, value=None),
+                ],
+                condition=FilterCondition.OR
+            ),
+            MetadataFilters(
+                filters=[MetadataFilters(filters=[MetadataFilter(key='title', value='Draft', operator=FilterOperator.TEXT_MATCH_INSENSITIVE)])],
+                condition=FilterCondition.NOT
+            ),
+        ],
+        condition=FilterCondition.AND
+    )
+
+
+@pytest.mark.parametrize('metadata_filters', [
+    MetadataFilters(filters=[MetadataFilter(key='url', value='https://example.com/a')]),
+    MetadataFilters(filters=[MetadataFilter(key='page', value=10, operator=FilterOperator.NE)]),
+    MetadataFilters(filters=[MetadataFilter(key='rank', value=0.5, operator=FilterOperator.GTE)]),
+    MetadataFilters(filters=[MetadataFilter(key='updated_date', value='2024-03-01T10:30:00', operator=FilterOperator.LTE)]),
+    MetadataFilters(filters=[MetadataFilter(key='title', value='Report', operator=FilterOperator.TEXT_MATCH)]),
+    MetadataFilters(filters=[MetadataFilter(key='title', value='Report', operator=FilterOperator.TEXT_MATCH_INSENSITIVE)]),
+    MetadataFilters(filters=[MetadataFilter(key='author', operator=FilterOperator.IS_EMPTY, value=None)]),
+    MetadataFilters(filters=[MetadataFilter(key=f'key{i}', value=i, operator=FilterOperator.LT) for i in range(12)]),
+    nested_filters(),
+], ids=['text', 'int', 'float', 'timestamp', 'text_match', 'text_match_insensitive', 'is_empty', 'many', 'nested'])
+def test_parameterized_filters_match_string_filters(metadata_filters):
+    filter_config = FilterConfig(metadata_filters)
+
+    (opencypher_filters, params) = filter_config_to_parameterized_opencypher_filters(filter_config)
+
+    assert inline_params(opencypher_filters, params) == filter_config_to_opencypher_filters(filter_config)
+
+
+def test_parameterized_filters_with_different_values_share_text():
+    first = FilterConfig(MetadataFilters(filters=[MetadataFilter(key='url', value='https://example.com/a')]))
+    second = FilterConfig(MetadataFilters(filters=[MetadataFilter(key='url', value="https://example.com/it's")]))
+
+    (first_filters, first_params) = filter_config_to_parameterized_opencypher_filters(first)
+    (second_filters, second_params) = filter_config_to_parameterized_opencypher_filters(second)
+
+    assert first_filters == second_filters
+    assert first_params == {'filter0': 'https://example.com/a'}
+    assert second_params == {'filter0': "https://example.com/it's"}
+
+
+def test_parameterized_filters_are_empty_without_source_filters():
+    assert filter_config_to_parameterized_opencypher_filters(None) == ('', {})
+    assert filter_config_to_parameterized_opencypher_filters(FilterConfig()) == ('', {})
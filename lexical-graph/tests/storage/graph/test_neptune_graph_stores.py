@@ -0,0 +1,96 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import json
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.storage.graph import neptune_graph_stores
+from graphrag_toolkit.lexical_graph.storage.graph.neptune_graph_stores import NeptuneAnalyticsClient, NeptuneDatabaseClient, NeptuneDatabaseGraphStoreFactory
+
+
+@pytest.fixture(autouse=True)
+def no_prewarm(monkeypatch):
+    monkeypatch.setattr(NeptuneDatabaseClient, 'prewarm', lambda self: None)
+
+
+@pytest.mark.parametrize('graph_info, endpoint_url', [
+    ('neptune-db://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com', 'https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8182'),
+    ('neptune-db://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8183', 'https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8183'),
+    ('my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com', 'https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8182'),
+    ('https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8182/', 'https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8182'),
+    ('https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8182/openCypher', 'https://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com:8182/openCypher'),
+    ('my-cluster.cluster-abc.cn-north-1.neptune.amazonaws.com.cn', 'https://my-cluster.cluster-abc.cn-north-1.neptune.amazonaws.com.cn:8182'),
+    ('https://my-cluster.cluster-abc.cn-north-1.neptune.amazonaws.com.cn:8182', 'https://my-cluster.cluster-abc.cn-north-1.neptune.amazonaws.com.cn:8182'),
+])
+def test_try_create_recognizes_neptune_database_endpoints(graph_info, endpoint_url):
+    graph_store = NeptuneDatabaseGraphStoreFactory().try_create(graph_info)
+
+    assert isinstance(graph_store, NeptuneDatabaseClient)
+    assert graph_store.endpoint_url == endpoint_url
+
+
+@pytest.mark.parametrize('graph_info', [
+    'neptune-graph://g-123456',
+    'bolt://localhost:7687',
+    'https://search-domain.us-east-1.es.amazonaws.com',
+])
+def test_try_create_ignores_other_endpoints(graph_info):
+    assert NeptuneDatabaseGraphStoreFactory().try_create(graph_info) is None
+
+
+class FakeNeptuneGraphClient:
+
+    def __init__(self, results):
+        self.results = results
+
+    def execute_query(self, **kwargs):
+        return {'payload': io.BytesIO(json.dumps({'results': self.results}).encode('utf-8'))}
+
+
+def test_execute_query_parses_results_from_the_payload_stream():
+    graph_store = NeptuneAnalyticsClient(graph_id='g-123456')
+    graph_store._client = FakeNeptuneGraphClient([{'a': 1}, {'a': 1.5}])
+
+    assert graph_store.execute_query('RETURN 1') == [{'a': 1}, {'a': 1.5}]
+
+
+@pytest.fixture
+def neptune_client_config(monkeypatch):
+    from graphrag_toolkit.lexical_graph import GraphRAGConfig
+    monkeypatch.setattr(GraphRAGConfig, '_neptune_connect_timeout_seconds', None)
+    monkeypatch.setattr(GraphRAGConfig, '_neptune_max_pool_connections', None)
+    monkeypatch.delenv('NEPTUNE_CONNECT_TIMEOUT_SECONDS', raising=False)
+    monkeypatch.delenv('NEPTUNE_MAX_POOL_CONNECTIONS', raising=False)
+    return GraphRAGConfig
+
+
+def test_create_config_uses_botocore_connection_defaults(neptune_client_config):
+    config = neptune_graph_stores.create_config()
+
+    assert config.connect_timeout == 60
+    assert config.max_pool_connections == 10
+    assert config.read_timeout == 600
+
+
+def test_create_config_reads_connection_settings_from_graphrag_config(neptune_client_config):
+    neptune_client_config.neptune_connect_timeout_seconds = 5
+    neptune_client_config.neptune_max_pool_connections = 32
+
+    config = neptune_graph_stores.create_config()
+
+    assert config.connect_timeout == 5
+    assert config.max_pool_connections == 32
+
+
+def test_create_config_applies_user_config_to_a_new_instance(neptune_client_config):
+    user_config = json.dumps({'connect_timeout': 3, 'retries': {'total_max_attempts': 4}})
+
+    config = neptune_graph_stores.create_config(user_config)
+    other_config = neptune_graph_stores.create_config(user_config)
+
+    assert config.connect_timeout == 3
+    assert config.retries == {'total_max_attempts': 4}
+    assert config is not other_config
+    assert config.retries is not other_config.retries
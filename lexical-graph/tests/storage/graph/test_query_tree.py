@@ -0,0 +1,62 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+import pytest
+
+from graphrag_toolkit.lexical_graph import GraphRAGConfig
+from graphrag_toolkit.lexical_graph.storage.graph import Query, QueryTree
+
+
+def tree():
+    a = Query('a', child_queries=[Query('a1'), Query('a2')])
+    b = Query('b')
+    return QueryTree('test', Query('root', child_queries=[a, b]))
+
+
+def graph_store_fn(delays=None, fail=None, barrier=None):
+
+    def fn(query, parameters):
+        if barrier and query in ('a', 'b'):
+            barrier.wait()
+        time.sleep((delays or {}).get(query, 0))
+        if query == fail:
+            raise ValueError(f'{query} failed')
+        return [{'query': query, 'parent': p.get('query')} for p in parameters['params']]
+
+    return fn
+
+
+def run(num_workers, **kwargs):
+    return [r['query'] for r in tree().run({'params': [{}]}, graph_store_fn(**kwargs), num_workers=num_workers)]
+
+
+def test_run_yields_leaf_results_depth_first_last_child_first():
+    assert run(num_workers=1) == ['b', 'a2', 'a1']
+
+
+@pytest.mark.parametrize('num_workers', [1, 4])
+def test_run_yields_same_order_regardless_of_completion_order(num_workers):
+    assert run(num_workers=num_workers, delays={'b': 0.1, 'a2': 0.05}) == ['b', 'a2', 'a1']
+
+
+def test_run_runs_sibling_queries_concurrently_when_enabled():
+    barrier = threading.Barrier(2, timeout=5)
+
+    assert run(num_workers=2, barrier=barrier) == ['b', 'a2', 'a1']
+
+
+@pytest.mark.parametrize('num_workers', [1, 4])
+def test_run_propagates_query_errors(num_workers):
+    with pytest.raises(ValueError, match='a1 failed'):
+        run(num_workers=num_workers, fail='a1')
+
+
+def test_run_is_sequential_by_default(monkeypatch):
+    monkeypatch.setattr(GraphRAGConfig, '_query_tree_num_workers', None, raising=False)
+    monkeypatch.delenv('QUERY_TREE_NUM_WORKERS', raising=False)
+
+    assert GraphRAGConfig.query_tree_num_workers == 1
+    assert [r['query'] for r in tree().run({'params': [{}]}, graph_store_fn())] == ['b', 'a2', 'a1']
@@ -0,0 +1,87 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.storage import graph_store_factory
+from graphrag_toolkit.lexical_graph.storage.graph import GraphStoreFactoryMethod
+from graphrag_toolkit.lexical_graph.storage.graph.dummy_graph_store import DummyGraphStore
+from graphrag_toolkit.lexical_graph.storage.graph.neptune_graph_stores import NeptuneAnalyticsGraphStoreFactory, NeptuneDatabaseGraphStoreFactory
+from graphrag_toolkit.lexical_graph.storage.graph.neo4j_graph_store_factory import Neo4jGraphStoreFactory
+from graphrag_toolkit.lexical_graph.storage.graph_store_factory import GraphStoreFactory, _factory_for_prefix
+
+
+class RecordingFactory(GraphStoreFactoryMethod):
+
+    def __init__(self, prefixes=(), result=None):
+        self.prefixes = prefixes
+        self.result = result
+        self.calls = []
+
+    def try_create(self, graph_info, **kwargs):
+        self.calls.append(graph_info)
+        return self.result
+
+
+class UnprefixedFactory(RecordingFactory):
+    pass
+
+
+@pytest.fixture
+def factories(monkeypatch):
+    monkeypatch.setattr(graph_store_factory, '_graph_store_factories', {})
+    monkeypatch.setattr(graph_store_factory, '_graph_store_factories_by_prefix', {})
+
+
+@pytest.mark.parametrize('graph_info, factory_type', [
+    ('neptune-graph://g-123456', NeptuneAnalyticsGraphStoreFactory),
+    ('neptune-db://my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com', NeptuneDatabaseGraphStoreFactory),
+    ('bolt://localhost:7687', Neo4jGraphStoreFactory),
+    ('neo4j+s://localhost:7687', Neo4jGraphStoreFactory),
+])
+def test_built_in_factories_are_indexed_by_prefix(graph_info, factory_type):
+    assert isinstance(_factory_for_prefix(graph_info), factory_type)
+
+
+@pytest.mark.parametrize('graph_info', [
+    'my-cluster.cluster-abc.us-east-1.neptune.amazonaws.com',
+    'unknown://localhost',
+    None,
+])
+def test_factory_for_prefix_returns_none_without_a_registered_prefix(graph_info):
+    assert _factory_for_prefix(graph_info) is None
+
+
+def test_for_graph_store_dispatches_directly_to_prefixed_factory(factories):
+    unprefixed = UnprefixedFactory(result='unprefixed')
+    prefixed = RecordingFactory(prefixes=('test://',), result='prefixed')
+    GraphStoreFactory.register(unprefixed)
+    GraphStoreFactory.register(prefixed)
+
+    assert GraphStoreFactory.for_graph_store('test://store') == 'prefixed'
+    assert unprefixed.calls == []
+
+
+def test_for_graph_store_falls_back_to_registration_order(factories):
+    prefixed = RecordingFactory(prefixes=('test://',))
+    unprefixed = UnprefixedFactory(result='unprefixed')
+    GraphStoreFactory.register(prefixed)
+    GraphStoreFactory.register(unprefixed)
+
+    assert GraphStoreFactory.for_graph_store('test://store') == 'unprefixed'
+    assert prefixed.calls == ['test://store']
+    assert unprefixed.calls == ['test://store']
+
+
+def test_for_graph_store_raises_for_unrecognized_info(factories):
+    prefixed = RecordingFactory(prefixes=('test://',))
+    GraphStoreFactory.register(prefixed)
+
+    with pytest.raises(ValueError):
+        GraphStoreFactory.for_graph_store('test://store')
+
+    assert prefixed.calls == ['test://store']
+
+
+def test_for_graph_store_creates_dummy_graph_store():
+    assert isinstance(GraphStoreFactory.for_graph_store('dummy://'), DummyGraphStore)
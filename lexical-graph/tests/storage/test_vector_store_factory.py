@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.storage import vector_store_factory
+from graphrag_toolkit.lexical_graph.storage.vector import VectorIndexFactoryMethod
+from graphrag_toolkit.lexical_graph.storage.vector.dummy_vector_index import DummyVectorIndex
+from graphrag_toolkit.lexical_graph.storage.vector.neptune_vector_indexes import NeptuneAnalyticsVectorIndexFactory
+from graphrag_toolkit.lexical_graph.storage.vector.opensearch_vector_index_factory import OpenSearchVectorIndexFactory
+from graphrag_toolkit.lexical_graph.storage.vector.pg_vector_index_factory import PGVectorIndexFactory
+from graphrag_toolkit.lexical_graph.storage.vector_store_factory import VectorStoreFactory, _factory_for_prefix
+
+
+class RecordingFactory(VectorIndexFactoryMethod):
+
+    def __init__(self, prefixes=(), create=False):
+        self.prefixes = prefixes
+        self.create = create
+        self.calls = []
+
+    def try_create(self, index_names, vector_index_info, **kwargs):
+        self.calls.append(vector_index_info)
+        if self.create:
+            return [DummyVectorIndex(index_name=index_name) for index_name in index_names]
+        return None
+
+
+class UnprefixedFactory(RecordingFactory):
+    pass
+
+
+@pytest.fixture
+def factories(monkeypatch):
+    monkeypatch.setattr(vector_store_factory, '_vector_index_factories', {})
+    monkeypatch.setattr(vector_store_factory, '_vector_index_factories_by_prefix', {})
+
+
+@pytest.mark.parametrize('vector_store_info, factory_type', [
+    ('neptune-graph://g-123456', NeptuneAnalyticsVectorIndexFactory),
+    ('aoss://my-collection', OpenSearchVectorIndexFactory),
+    ('postgres://user@localhost:5432/db', PGVectorIndexFactory),
+    ('postgresql://user@localhost:5432/db', PGVectorIndexFactory),
+])
+def test_built_in_factories_are_indexed_by_prefix(vector_store_info, factory_type):
+    assert isinstance(_factory_for_prefix(vector_store_info), factory_type)
+
+
+@pytest.mark.parametrize('vector_store_info', [
+    'https://abc.us-east-1.aoss.amazonaws.com',
+    'unknown://localhost',
+    None,
+])
+def test_factory_for_prefix_returns_none_without_a_registered_prefix(vector_store_info):
+    assert _factory_for_prefix(vector_store_info) is None
+
+
+def test_for_vector_store_dispatches_directly_to_prefixed_factory(factories):
+    unprefixed = UnprefixedFactory(create=True)
+    prefixed = RecordingFactory(prefixes=('test://',), create=True)
+    VectorStoreFactory.register(unprefixed)
+    VectorStoreFactory.register(prefixed)
+
+    vector_store = VectorStoreFactory.for_vector_store('test://store', index_names=['chunk'])
+
+    assert list(vector_store.indexes.keys()) == ['chunk']
+    assert prefixed.calls == ['test://store']
+    assert unprefixed.calls == []
+
+
+def test_for_vector_store_falls_back_to_registration_order(factories):
+    prefixed = RecordingFactory(prefixes=('test://',))
+    unprefixed = UnprefixedFactory(create=True)
+    VectorStoreFactory.register(prefixed)
+    VectorStoreFactory.register(unprefixed)
+
+    VectorStoreFactory.for_vector_store('test://store', index_names=['chunk'])
+
+    assert prefixed.calls == ['test://store']
+    assert unprefixed.calls == ['test://store']
+
+
+def test_for_vector_store_raises_for_unrecognized_info(factories):
+    prefixed = RecordingFactory(prefixes=('test://',))
+    VectorStoreFactory.register(prefixed)
+
+    with pytest.raises(ValueError):
+        VectorStoreFactory.for_vector_store('test://store')
+
+    assert prefixed.calls == ['test://store']
+
+
+def test_for_vector_store_creates_dummy_indexes():
+    vector_store = VectorStoreFactory.for_vector_store('dummy://', index_names=['chunk', 'statement'])
+
+    assert all(isinstance(index, DummyVectorIndex) for index in vector_store.indexes.values())
+    assert set(vector_store.indexes.keys()) == {'chunk', 'statement'}
@@ -0,0 +1,88 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List
+
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import TextNode
+
+from graphrag_toolkit.lexical_graph.storage.vector.embedding_cache import EmbeddingCache, embed_nodes_with_cache
+
+
+class CountingEmbedding(MockEmbedding):
+    texts: List[str] = []
+
+    def _get_text_embedding(self, text):
+        self.texts.append(text)
+        return [float(len(text))] * self.embed_dim
+
+    def _get_text_embeddings(self, texts):
+        return [self._get_text_embedding(text) for text in texts]
+
+
+def test_repeated_content_is_served_from_the_cache():
+    embed_model = CountingEmbedding(embed_dim=2)
+    cache = EmbeddingCache(embed_model, max_size=10)
+
+    first = cache.embed_nodes([TextNode(id_='1', text='alpha')])
+    second = cache.embed_nodes([TextNode(id_='2', text='alpha'), TextNode(id_='3', text='beta')])
+
+    assert second['2'] == first['1']
+    assert embed_model.texts == ['alpha', 'beta']
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_duplicate_content_within_a_call_is_embedded_once():
+    embed_model = CountingEmbedding(embed_dim=2)
+    cache = EmbeddingCache(embed_model, max_size=10)
+
+    embeddings = cache.embed_nodes([TextNode(id_='1', text='alpha'), TextNode(id_='2', text='alpha')])
+
+    assert embeddings['1'] == embeddings['2']
+    assert embed_model.texts == ['alpha']
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_is_keyed_by_embedded_content():
+    embed_model = CountingEmbedding(embed_dim=2)
+    cache = EmbeddingCache(embed_model, max_size=10)
+
+    cache.embed_nodes([TextNode(id_='1', text='alpha', metadata={'source': 'a'})])
+    cache.embed_nodes([TextNode(id_='2', text='alpha', metadata={'source': 'a'})])
+    cache.embed_nodes([TextNode(id_='3', text='alpha', metadata={'source': 'b'})])
+    cache.embed_nodes([TextNode(id_='4', text='alpha', metadata={'source': 'c'}, excluded_embed_metadata_keys=['source'])])
+
+    assert len(embed_model.texts) == 3
+    assert cache.hits == 1
+
+
+def test_nodes_with_embeddings_keep_them():
+    embed_model = CountingEmbedding(embed_dim=2)
+    cache = EmbeddingCache(embed_model, max_size=10)
+
+    embeddings = cache.embed_nodes([TextNode(id_='1', text='alpha', embedding=[9.0, 9.0])])
+
+    assert embeddings == {'1': [9.0, 9.0]}
+    assert embed_model.texts == []
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_least_recently_used_embeddings_are_evicted():
+    embed_model = CountingEmbedding(embed_dim=2)
+    cache = EmbeddingCache(embed_model, max_size=2)
+
+    cache.embed_nodes([TextNode(id_='1', text='a'), TextNode(id_='2', text='bb')])
+    cache.embed_nodes([TextNode(id_='3', text='a')])
+    cache.embed_nodes([TextNode(id_='4', text='ccc')])
+    cache.embed_nodes([TextNode(id_='5', text='a'), TextNode(id_='6', text='bb')])
+
+    assert embed_model.texts == ['a', 'bb', 'ccc', 'bb']
+
+
+def test_embed_nodes_with_cache_embeds_every_node_without_a_cache():
+    embed_model = CountingEmbedding(embed_dim=2)
+
+    embeddings = embed_nodes_with_cache([TextNode(id_='1', text='alpha'), TextNode(id_='2', text='alpha')], embed_model)
+
+    assert set(embeddings.keys()) == {'1', '2'}
+    assert embed_model.texts == ['alpha', 'alpha']
@@ -0,0 +1,41 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from graphrag_toolkit.lexical_graph import TenantId
+from graphrag_toolkit.lexical_graph.storage.vector import VectorStore, MultiTenantVectorStore, DummyVectorIndex
+
+
+def test_get_index_sets_tenant_id():
+    inner = VectorStore(indexes={'chunk': DummyVectorIndex(index_name='chunk')})
+    store = MultiTenantVectorStore.wrap(inner, TenantId('t1'))
+
+    index = store.get_index('chunk')
+
+    assert index.tenant_id.value == 't1'
+
+
+def test_get_index_reflects_changes_to_inner_indexes():
+    inner = VectorStore(indexes={'chunk': DummyVectorIndex(index_name='chunk')})
+    store = MultiTenantVectorStore.wrap(inner, TenantId('t1'))
+    store.get_index('chunk')
+    store.all_indexes()
+
+    replacement = DummyVectorIndex(index_name='chunk')
+    inner.indexes['chunk'] = replacement
+    inner.indexes['statement'] = DummyVectorIndex(index_name='statement')
+
+    assert store.get_index('chunk') is replacement
+    assert sorted(index.index_name for index in store.all_indexes()) == ['chunk', 'statement']
+
+
+def test_default_tenant_store_resets_shared_index_tenant():
+    inner = VectorStore(indexes={'chunk': DummyVectorIndex(index_name='chunk')})
+    tenant_store = MultiTenantVectorStore.wrap(inner, TenantId('t1'))
+    default_store = MultiTenantVectorStore.wrap(inner, TenantId())
+
+    assert default_store is not inner
+
+    default_store.get_index('chunk')
+    tenant_store.get_index('chunk')
+
+    assert default_store.get_index('chunk').tenant_id.is_default_tenant()
@@ -0,0 +1,159 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import pickle
+
+import pytest
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import QueryBundle, TextNode
+from llama_index.core.vector_stores.types import MetadataFilters, MetadataFilter
+
+from graphrag_toolkit.lexical_graph.metadata import FilterConfig
+from graphrag_toolkit.lexical_graph.storage.graph.neptune_graph_stores import NeptuneAnalyticsClient
+from graphrag_toolkit.lexical_graph.storage.vector.neptune_vector_indexes import NeptuneIndex
+
+
+class FakeNeptuneAnalyticsClient(NeptuneAnalyticsClient):
+
+    def __init__(self, graph_id='test-graph', **kwargs):
+        super().__init__(graph_id=graph_id, **kwargs)
+        self._queries = []
+        self._results = []
+
+    def _execute_query(self, cypher, parameters={}, correlation_id=None):
+        self._queries.append((cypher, parameters))
+        return self._results.pop(0) if self._results else []
+
+
+@pytest.fixture
+def client():
+    return FakeNeptuneAnalyticsClient()
+
+
+@pytest.fixture
+def index(client):
+    return NeptuneIndex.for_index('chunk', client, embed_model=MockEmbedding(embed_dim=4), dimensions=4)
+
+
+def assert_with_clauses_are_valid(cypher):
+    # in openCypher, a WITH clause's WHERE must follow its ORDER BY, SKIP and LIMIT
+    for clause in re.split(r'\bWITH\b', cypher)[1:]:
+        clause = re.split(r'\b(?:MATCH|RETURN|CALL|UNWIND)\b', clause)[0]
+        where = clause.find('WHERE')
+        for keyword in ('ORDER BY', 'LIMIT'):
+            position = clause.find(keyword)
+            assert where == -1 or position == -1 or where > position, clause
+
+
+def test_top_k_without_filter_limits_candidates_before_traversal(index, client):
+    index.top_k(QueryBundle(query_str='query'), top_k=3)
+
+    (cypher, params) = client._queries[-1]
+
+    assert_with_clauses_are_valid(cypher)
+    assert re.search(r'WITH chunk, score ORDER BY score ASC LIMIT 3\s+MATCH', cypher)
+    assert 'topK: 15' in cypher
+    assert params['tenantLabel'] == '__Chunk__'
+
+
+def test_top_k_with_filter_does_not_limit_candidates_before_filtering(index, client):
+    filter_config = FilterConfig(MetadataFilters(filters=[MetadataFilter(key='url', value='x')]))
+
+    index.top_k(QueryBundle(query_str='query'), top_k=3, filter_config=filter_config)
+
+    (cypher, _) = client._queries[-1]
+
+    assert_with_clauses_are_valid(cypher)
+    assert 'WITH chunk, score ORDER BY' not in cypher
+    assert cypher.index('MATCH') < cypher.index('ORDER BY score ASC LIMIT 3')
+
+
+def test_top_k_returns_results_sorted_by_score(index, client):
+    client._results.append([
+        {'result': {'score': 0.3, 'chunk': {'chunkId': 'c3'}}},
+        {'result': {'score': 0.1, 'chunk': {'chunkId': 'c1'}}},
+    ])
+
+    results = index.top_k(QueryBundle(query_str='query'), top_k=2)
+
+    assert [r['chunk']['chunkId'] for r in results] == ['c1', 'c3']
+
+
+def test_top_k_batch_searches_each_distinct_query_once(monkeypatch, index):
+    calls = []
+
+    def top_k(self, query_bundle, top_k=5, filter_config=None):
+        calls.append(query_bundle.query_str)
+        return [{'score': 0.1, 'chunk': {'chunkId': query_bundle.query_str}}]
+
+    monkeypatch.setattr(NeptuneIndex, 'top_k', top_k)
+
+    results = index.top_k_batch([QueryBundle(query_str='a'), QueryBundle(query_str='b'), QueryBundle(query_str='a')], top_k=2)
+
+    assert sorted(calls) == ['a', 'b']
+    assert [[r['chunk']['chunkId'] for r in query_results] for query_results in results] == [['a'], ['b'], ['a']]
+    assert results[0] is not results[2]
+
+
+def test_top_k_batch_with_no_queries_does_not_query(index, client):
+    assert index.top_k_batch([]) == []
+    assert client._queries == []
+
+
+@pytest.fixture
+def result_cache(monkeypatch):
+    from graphrag_toolkit.lexical_graph import GraphRAGConfig
+    from graphrag_toolkit.lexical_graph.storage.vector import neptune_vector_indexes
+    monkeypatch.setattr(GraphRAGConfig, '_vector_query_cache_size', 10)
+    monkeypatch.setattr(GraphRAGConfig, '_vector_query_cache_ttl_seconds', 60)
+    monkeypatch.setattr(neptune_vector_indexes, '_top_k_result_cache', None)
+    monkeypatch.setattr(neptune_vector_indexes, '_top_k_result_cache_versions', {})
+
+
+def new_index(client):
+    return NeptuneIndex.for_index('chunk', client, embed_model=MockEmbedding(embed_dim=4), dimensions=4)
+
+
+def test_top_k_results_are_shared_by_indexes_for_the_same_graph(result_cache, client):
+    new_index(client).top_k(QueryBundle(query_str='query'))
+    new_index(client).top_k(QueryBundle(query_str='query'))
+
+    assert len(client._queries) == 1
+
+    new_index(FakeNeptuneAnalyticsClient(graph_id='other-graph')).top_k(QueryBundle(query_str='query'))
+
+    assert len(client._queries) == 1
+
+
+def test_add_embeddings_through_another_index_invalidates_cached_results(result_cache, client):
+    reader = new_index(client)
+    reader.top_k(QueryBundle(query_str='query'))
+
+    new_index(client).add_embeddings([TextNode(id_='c1', text='chunk')])
+    reader.top_k(QueryBundle(query_str='query'))
+
+    top_k_queries = [cypher for (cypher, _) in client._queries if 'topKByEmbedding' in cypher]
+    assert len(top_k_queries) == 2
+
+
+def test_index_survives_a_pickle_round_trip(index, client):
+    index.top_k(QueryBundle(query_str='query'))
+
+    restored = pickle.loads(pickle.dumps(index))
+    restored.top_k(QueryBundle(query_str='query'))
+
+    assert restored.index_name == 'chunk'
+    assert restored.neptune_client.graph_id == 'test-graph'
+    assert index._cypher_cache
+
+
+def test_vector_indexing_keeps_its_vector_store_through_pickling(index):
+    from graphrag_toolkit.lexical_graph.indexing.build.vector_indexing import VectorIndexing
+    from graphrag_toolkit.lexical_graph.storage.vector import VectorStore
+
+    vector_indexing = VectorIndexing.for_vector_store(VectorStore(indexes={'chunk': index}))
+
+    restored = pickle.loads(pickle.dumps(vector_indexing))
+
+    assert restored.vector_store.get_index('chunk').index_name == 'chunk'
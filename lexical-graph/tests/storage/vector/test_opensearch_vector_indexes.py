@@ -0,0 +1,75 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+pytest.importorskip('opensearchpy')
+pytest.importorskip('llama_index.vector_stores.opensearch')
+
+from llama_index.core.schema import TextNode
+
+from graphrag_toolkit.lexical_graph.storage.vector import opensearch_vector_indexes
+
+
+class FakeClient:
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConfig:
+    session = object()
+    aws_region = 'us-east-1'
+
+
+@pytest.fixture
+def admin_clients(monkeypatch):
+    monkeypatch.setattr(opensearch_vector_indexes, 'create_os_client', FakeClient)
+    monkeypatch.setattr(opensearch_vector_indexes, 'GraphRAGConfig', FakeConfig())
+    monkeypatch.setattr(opensearch_vector_indexes, '_index_admin_clients', {})
+    return opensearch_vector_indexes
+
+
+def test_index_admin_client_is_shared_per_endpoint(admin_clients):
+    client = admin_clients._index_admin_client('https://a')
+
+    assert admin_clients._index_admin_client('https://a') is client
+    assert admin_clients._index_admin_client('https://b') is not client
+
+
+def test_index_admin_client_is_replaced_when_session_changes(admin_clients):
+    client = admin_clients._index_admin_client('https://a')
+
+    admin_clients.GraphRAGConfig.session = object()
+    replacement = admin_clients._index_admin_client('https://a')
+
+    assert replacement is not client
+    assert client.closed
+
+
+def test_index_admin_client_is_replaced_when_expired(admin_clients, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(admin_clients.time, 'monotonic', lambda: now[0])
+
+    client = admin_clients._index_admin_client('https://a')
+    now[0] += admin_clients.INDEX_ADMIN_CLIENT_TTL_SECONDS - 1
+    assert admin_clients._index_admin_client('https://a') is client
+
+    now[0] += 1
+    replacement = admin_clients._index_admin_client('https://a')
+
+    assert replacement is not client
+    assert client.closed
+
+
+def test_close_index_admin_clients(admin_clients):
+    clients = [admin_clients._index_admin_client(endpoint) for endpoint in ['https://a', 'https://b']]
+
+    admin_clients._close_index_admin_clients()
+
+    assert all(client.closed for client in clients)
+    assert admin_clients._index_admin_client('https://a') not in clients
@@ -0,0 +1,70 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.storage.vector import query_result_cache
+from graphrag_toolkit.lexical_graph.storage.vector.query_result_cache import QueryResultCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(query_result_cache.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_get_returns_cached_value_and_counts_hits_and_misses(clock):
+    cache = QueryResultCache(max_size=10, ttl_seconds=60)
+
+    assert cache.get('q') is None
+    cache.put('q', [{'score': 0.1}])
+
+    assert cache.get('q') == [{'score': 0.1}]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = QueryResultCache(max_size=10, ttl_seconds=60)
+    cache.put('q', [{'score': 0.1}])
+
+    clock[0] += 60
+    assert cache.get('q') == [{'score': 0.1}]
+
+    clock[0] += 1
+    assert cache.get('q') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = QueryResultCache(max_size=2, ttl_seconds=60)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.evictions == 1
+
+
+def test_cached_values_are_isolated_from_callers(clock):
+    cache = QueryResultCache(max_size=10, ttl_seconds=60)
+    results = [{'score': 0.1, 'chunk': {'chunkId': 'c1', 'metadata': {'tags': ['a']}}}]
+    cache.put('q', results)
+
+    results[0]['chunk']['metadata']['tags'].append('b')
+    cached = cache.get('q')
+    cached[0]['score'] = 0.9
+    cached[0]['chunk']['chunkId'] = 'c2'
+
+    assert cache.get('q') == [{'score': 0.1, 'chunk': {'chunkId': 'c1', 'metadata': {'tags': ['a']}}}]
+
+
+def test_clear_removes_all_entries(clock):
+    cache = QueryResultCache(max_size=10, ttl_seconds=60)
+    cache.put('q', 1)
+    cache.clear()
+
+    assert cache.get('q') is None
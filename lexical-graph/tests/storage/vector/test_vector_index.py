@@ -0,0 +1,25 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+
+from llama_index.core.schema import QueryBundle
+
+from graphrag_toolkit.lexical_graph.storage.vector import DummyVectorIndex
+
+
+class EchoVectorIndex(DummyVectorIndex):
+
+    def top_k(self, query_bundle, top_k=5, filter_config=None):
+        # finish the first queries last, so that results complete out of order
+        time.sleep(0.05 / len(query_bundle.query_str))
+        return [{'query': query_bundle.query_str, 'top_k': top_k}]
+
+
+def test_default_top_k_batch_returns_results_in_query_order():
+    index = EchoVectorIndex(index_name='chunk')
+    queries = ['a', 'bb', 'ccc', 'dddd']
+
+    results = index.top_k_batch([QueryBundle(query_str=q) for q in queries], top_k=3)
+
+    assert results == [[{'query': q, 'top_k': 3}] for q in queries]